@@ -5,7 +5,8 @@ Utility functions for web scraping with retry logic, user-agent rotation, and er
 import time
 import random
 import logging
-from typing import Callable, Any, Optional, List
+import threading
+from typing import Callable, Any, Dict, Iterable, Optional, List
 
 import pandas as pd
 import numpy as np
@@ -21,6 +22,11 @@ from src.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Scrape services run their fetches in worker threads, so concurrent
+# /scrape requests would otherwise hit PFR in parallel. Holding this
+# around each fetch (delay included) keeps requests one at a time.
+_selenium_fetch_lock = threading.Lock()
+
 
 def strip_url_hash(url: str) -> str:
     """
@@ -81,6 +87,10 @@ def clean_value(v):
     Returns:
         Pure Python value, or None if NaN/NA
     """
+    # Scraped cell text is always str; skip the pandas/numpy checks for it.
+    if type(v) is str:
+        return v
+
     try:
         if pd.isna(v):
             return None
@@ -93,13 +103,59 @@ def clean_value(v):
     return v
 
 
+def clean_player_name(name: str) -> str:
+    """
+    Strip PFR's Pro Bowl (*) and All-Pro (+) markers from a player name.
+
+    Args:
+        name: Player name as shown in the PFR table
+
+    Returns:
+        Player name without trailing award markers
+    """
+    return name.rstrip("*+")
+
+
+def build_cell_mapper(column_map: Dict[str, str]) -> Callable[[List[Tag]], dict]:
+    """
+    Build a row mapper specialised to one service's COLUMN_MAP.
+
+    Services call this once at import time; the returned function has the
+    column lookup and value cleaner bound as locals, so the per-cell loop
+    does no global or attribute lookups. Every mapped field is present in
+    the returned row (None when the page has no such cell), so callers can
+    index it directly instead of probing with ``in``/``.get``.
+
+    Args:
+        column_map: Mapping of PFR ``data-stat`` names to entity field names
+
+    Returns:
+        Function taking a row's ``<td>`` cells and returning a field -> value dict
+    """
+    lookup = column_map.get
+    clean = clean_value
+    fields = tuple(column_map.values())
+
+    def map_cells(cells: List[Tag]) -> dict:
+        row = dict.fromkeys(fields)
+        for cell in cells:
+            stat = cell.get("data-stat")
+            field = lookup(stat) if isinstance(stat, str) else None
+            if field is not None:
+                row[field] = clean(cell.text.strip())
+        return row
+
+    return map_cells
+
+
 def fetch_page_with_selenium(url: str) -> str:
     """
     Fetch a page using Selenium stealth to bypass Cloudflare/bot detection.
 
     Includes: headless Chrome, anti-automation flags, random user-agent,
     optional proxy, Cloudflare wait, selenium_stealth integration,
-    rate limiting via SCRAPE_DELAY_SECONDS.
+    rate limiting via SCRAPE_DELAY_SECONDS. Fetches are serialized across
+    threads so only one request to PFR is in flight at a time.
 
     Args:
         url: URL to fetch
@@ -112,52 +168,53 @@ def fetch_page_with_selenium(url: str) -> str:
         logger.info(f"Stripped hash fragment from URL: {url} -> {clean_url}")
         url = clean_url
 
-    time.sleep(settings.SCRAPE_DELAY_SECONDS)
-
-    options = Options()
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("--start-minimized")
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option("useAutomationExtension", False)
-
-    user_agent = get_random_user_agent()
-    options.add_argument(f"user-agent={user_agent}")
-    logger.debug(f"Using user-agent: {user_agent[:50]}...")
-
-    proxy = get_random_proxy()
-    if proxy:
-        options.add_argument(f"--proxy-server={proxy}")
-        logger.debug(f"Using proxy: {proxy}")
-
-    driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
-        options=options,
-    )
+    with _selenium_fetch_lock:
+        time.sleep(settings.SCRAPE_DELAY_SECONDS)
+
+        options = Options()
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_argument("--window-size=1920,1080")
+        options.add_argument("--start-minimized")
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option("useAutomationExtension", False)
+
+        user_agent = get_random_user_agent()
+        options.add_argument(f"user-agent={user_agent}")
+        logger.debug(f"Using user-agent: {user_agent[:50]}...")
+
+        proxy = get_random_proxy()
+        if proxy:
+            options.add_argument(f"--proxy-server={proxy}")
+            logger.debug(f"Using proxy: {proxy}")
+
+        driver = webdriver.Chrome(
+            service=Service(ChromeDriverManager().install()),
+            options=options,
+        )
 
-    driver.set_page_load_timeout(settings.SCRAPE_REQUEST_TIMEOUT)
+        driver.set_page_load_timeout(settings.SCRAPE_REQUEST_TIMEOUT)
 
-    driver.execute_script(
-        "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-    )
+        driver.execute_script(
+            "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+        )
 
-    try:
-        driver.get(url)
-        time.sleep(10)  # Wait for Cloudflare challenge to auto-resolve
+        try:
+            driver.get(url)
+            time.sleep(10)  # Wait for Cloudflare challenge to auto-resolve
 
-        if "Just a moment" in driver.title:
-            logger.info("Waiting for Cloudflare challenge...")
-            time.sleep(15)
+            if "Just a moment" in driver.title:
+                logger.info("Waiting for Cloudflare challenge...")
+                time.sleep(15)
 
-        page_source = driver.page_source
-        logger.info(
-            f"Page loaded - Title: {driver.title}, Length: {len(page_source)} chars"
-        )
-        return page_source
-    finally:
-        driver.quit()
+            page_source = driver.page_source
+            logger.info(
+                f"Page loaded - Title: {driver.title}, Length: {len(page_source)} chars"
+            )
+            return page_source
+        finally:
+            driver.quit()
 
 
 def fetch_page(url: str) -> str:
@@ -188,37 +245,74 @@ def fetch_page(url: str) -> str:
     )
 
 
-def find_pfr_table(page_source: str, table_id: str) -> Optional[Tag]:
+def find_pfr_tables(
+    page_source: str, table_ids: Iterable[str]
+) -> Dict[str, Optional[Tag]]:
     """
-    Find a table by ID in PFR HTML, checking visible DOM first then HTML comments.
+    Find several tables by ID in PFR HTML with a single parse of the page.
 
-    Pro-Football-Reference hides some tables inside HTML comments;
-    this function checks both locations.
+    Pages like the season index carry more than one table we want (AFC and
+    NFC standings); parsing the document once and looking every ID up in the
+    same tree avoids re-tokenizing the whole page per table.
 
     Args:
         page_source: Raw HTML page source
-        table_id: The ID attribute of the target table
+        table_ids: The ID attributes of the target tables
 
     Returns:
-        BeautifulSoup Tag for the table, or None if not found
+        Dict mapping each table ID to its BeautifulSoup Tag, or None if not found
     """
     soup = BeautifulSoup(page_source, "lxml")
+    found: Dict[str, Optional[Tag]] = {}
+    missing = []
 
     # Check visible DOM first
-    table = soup.find("table", id=table_id)
-    if table is not None and isinstance(table, Tag):
-        return table
+    for table_id in table_ids:
+        table = soup.find("table", id=table_id)
+        if table is not None and isinstance(table, Tag):
+            found[table_id] = table
+        else:
+            found[table_id] = None
+            missing.append(table_id)
+
+    if not missing:
+        return found
 
     # Check HTML comments (PFR hides tables in comments)
     comments = soup.find_all(string=lambda x: isinstance(x, Comment))
     for c in comments:
-        if table_id in c:
-            comment_soup = BeautifulSoup(c, "lxml")
+        wanted = [table_id for table_id in missing if table_id in c]
+        if not wanted:
+            continue
+
+        comment_soup = BeautifulSoup(c, "lxml")
+        for table_id in wanted:
             table = comment_soup.find("table", id=table_id)
             if table is not None and isinstance(table, Tag):
-                return table
+                found[table_id] = table
+                missing.remove(table_id)
+
+        if not missing:
+            break
 
-    return None
+    return found
+
+
+def find_pfr_table(page_source: str, table_id: str) -> Optional[Tag]:
+    """
+    Find a table by ID in PFR HTML, checking visible DOM first then HTML comments.
+
+    Pro-Football-Reference hides some tables inside HTML comments;
+    this function checks both locations.
+
+    Args:
+        page_source: Raw HTML page source
+        table_id: The ID attribute of the target table
+
+    Returns:
+        BeautifulSoup Tag for the table, or None if not found
+    """
+    return find_pfr_tables(page_source, [table_id])[table_id]
 
 
 def retry_with_backoff(
@@ -15,6 +15,11 @@ from typing import Literal, Optional, cast
 
 from src.core.config import settings
 
+try:
+    from scrapling.fetchers import Fetcher, StealthyFetcher
+except ImportError:  # optional dependency; checked at fetch time
+    Fetcher = StealthyFetcher = None  # type: ignore[assignment,misc]
+
 logger = logging.getLogger(__name__)
 
 Impersonate = Literal[
@@ -73,7 +78,11 @@ def fetch_page_with_scrapling(url: str) -> str:
         ImportError: If scrapling is not installed
         RuntimeError: If the fetch returns an empty/error response
     """
-    from scrapling.fetchers import Fetcher, StealthyFetcher
+    if Fetcher is None or StealthyFetcher is None:
+        raise ImportError(
+            "scrapling is not installed; install it to use SCRAPE_BACKEND=scrapling"
+        )
+
     from src.core.scraper_utils import strip_url_hash
 
     clean_url = strip_url_hash(url)
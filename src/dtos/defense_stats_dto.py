@@ -2,7 +2,6 @@
 DTOs for defense stats operations.
 """
 
-from decimal import Decimal
 from typing import Optional
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -35,7 +34,7 @@ class DefenseStatsCreate(BaseModel):
     fr_yds: Optional[int] = Field(None, ge=0, description="Fumble recovery yards")
     fr_td: Optional[int] = Field(None, ge=0, description="Fumble recovery touchdowns")
 
-    sk: Optional[Decimal] = Field(None, ge=0, description="Sacks")
+    sk: Optional[float] = Field(None, ge=0, description="Sacks")
     comb: Optional[int] = Field(None, ge=0, description="Combined tackles")
     solo: Optional[int] = Field(None, ge=0, description="Solo tackles")
     ast: Optional[int] = Field(None, ge=0, description="Assisted tackles")
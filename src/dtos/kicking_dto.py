@@ -2,7 +2,6 @@
 DTOs for team kicking operations.
 """
 
-from decimal import Decimal
 from typing import Optional
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -31,20 +30,20 @@ class KickingCreate(BaseModel):
     fgm: Optional[int] = Field(None, ge=0, description="Total FG made")
 
     lng: Optional[int] = Field(None, ge=0, description="Longest field goal")
-    fg_pct: Optional[Decimal] = Field(None, ge=0, le=100, description="FG percentage")
+    fg_pct: Optional[float] = Field(None, ge=0, le=100, description="FG percentage")
     xpa: Optional[int] = Field(None, ge=0, description="Extra point attempts")
     xpm: Optional[int] = Field(None, ge=0, description="Extra points made")
-    xp_pct: Optional[Decimal] = Field(
+    xp_pct: Optional[float] = Field(
         None, ge=0, le=100, description="Extra point percentage"
     )
 
     ko: Optional[int] = Field(None, ge=0, description="Kickoffs")
     ko_yds: Optional[int] = Field(None, ge=0, description="Kickoff yards")
     tb: Optional[int] = Field(None, ge=0, description="Touchbacks")
-    tb_pct: Optional[Decimal] = Field(
+    tb_pct: Optional[float] = Field(
         None, ge=0, le=100, description="Touchback percentage"
     )
-    ko_avg: Optional[Decimal] = Field(None, ge=0, description="Kickoff average")
+    ko_avg: Optional[float] = Field(None, ge=0, description="Kickoff average")
 
 
 class KickingResponse(KickingCreate):
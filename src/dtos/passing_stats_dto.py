@@ -2,7 +2,6 @@
 DTOs for passing stats operations.
 """
 
-from decimal import Decimal
 from typing import Optional
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -26,36 +25,34 @@ class PassingStatsCreate(BaseModel):
 
     cmp: Optional[int] = Field(None, ge=0, description="Completions")
     att: Optional[int] = Field(None, ge=0, description="Attempts")
-    cmp_pct: Optional[Decimal] = Field(
+    cmp_pct: Optional[float] = Field(
         None, ge=0, le=100, description="Completion percentage"
     )
     yds: Optional[int] = Field(None, ge=0, description="Passing yards")
     td: Optional[int] = Field(None, ge=0, description="Touchdowns")
-    td_pct: Optional[Decimal] = Field(
+    td_pct: Optional[float] = Field(
         None, ge=0, le=100, description="Touchdown percentage"
     )
     ints: Optional[int] = Field(None, ge=0, description="Interceptions")
-    int_pct: Optional[Decimal] = Field(
+    int_pct: Optional[float] = Field(
         None, ge=0, le=100, description="Interception percentage"
     )
     first_downs: Optional[int] = Field(None, ge=0, description="First downs")
-    succ_pct: Optional[Decimal] = Field(
+    succ_pct: Optional[float] = Field(
         None, ge=0, le=100, description="Success percentage"
     )
     lng: Optional[int] = Field(None, ge=0, description="Longest pass")
-    ypa: Optional[Decimal] = Field(None, ge=0, description="Yards per attempt")
-    ay_pa: Optional[Decimal] = Field(None, description="Adjusted yards per attempt")
-    ypc: Optional[Decimal] = Field(None, ge=0, description="Yards per completion")
-    ypg: Optional[Decimal] = Field(None, ge=0, description="Yards per game")
-    rate: Optional[Decimal] = Field(None, ge=0, description="Passer rating")
-    qbr: Optional[Decimal] = Field(None, ge=0, description="QB rating")
+    ypa: Optional[float] = Field(None, ge=0, description="Yards per attempt")
+    ay_pa: Optional[float] = Field(None, description="Adjusted yards per attempt")
+    ypc: Optional[float] = Field(None, ge=0, description="Yards per completion")
+    ypg: Optional[float] = Field(None, ge=0, description="Yards per game")
+    rate: Optional[float] = Field(None, ge=0, description="Passer rating")
+    qbr: Optional[float] = Field(None, ge=0, description="QB rating")
     sk: Optional[int] = Field(None, ge=0, description="Sacks")
     yds_sack: Optional[int] = Field(None, ge=0, description="Sack yards")
-    sk_pct: Optional[Decimal] = Field(None, ge=0, le=100, description="Sack percentage")
-    ny_pa: Optional[Decimal] = Field(None, description="Net yards per attempt")
-    any_pa: Optional[Decimal] = Field(
-        None, description="Adjusted net yards per attempt"
-    )
+    sk_pct: Optional[float] = Field(None, ge=0, le=100, description="Sack percentage")
+    ny_pa: Optional[float] = Field(None, description="Net yards per attempt")
+    any_pa: Optional[float] = Field(None, description="Adjusted net yards per attempt")
     four_qc: Optional[int] = Field(None, ge=0, description="Fourth quarter comebacks")
     gwd: Optional[int] = Field(None, ge=0, description="Game winning drives")
 
@@ -2,7 +2,6 @@
 DTOs for team punting operations.
 """
 
-from decimal import Decimal
 from typing import Optional
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -18,17 +17,17 @@ class PuntingCreate(BaseModel):
 
     pnt: Optional[int] = Field(None, ge=0, description="Punts")
     yds: Optional[int] = Field(None, ge=0, description="Punt yards")
-    ypp: Optional[Decimal] = Field(None, ge=0, description="Yards per punt")
+    ypp: Optional[float] = Field(None, ge=0, description="Yards per punt")
     retyds: Optional[int] = Field(None, ge=0, description="Return yards allowed")
     net: Optional[int] = Field(None, ge=0, description="Net yards")
-    nyp: Optional[Decimal] = Field(None, ge=0, description="Net yards per punt")
+    nyp: Optional[float] = Field(None, ge=0, description="Net yards per punt")
     lng: Optional[int] = Field(None, ge=0, description="Longest punt")
     tb: Optional[int] = Field(None, ge=0, description="Touchbacks")
-    tb_pct: Optional[Decimal] = Field(
+    tb_pct: Optional[float] = Field(
         None, ge=0, le=100, description="Touchback percentage"
     )
     in20: Optional[int] = Field(None, ge=0, description="Punts inside 20")
-    in20_pct: Optional[Decimal] = Field(
+    in20_pct: Optional[float] = Field(
         None, ge=0, le=100, description="Inside 20 percentage"
     )
     blck: Optional[int] = Field(None, ge=0, description="Blocked punts")
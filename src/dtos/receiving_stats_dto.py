@@ -2,7 +2,6 @@
 DTOs for receiving stats operations.
 """
 
-from decimal import Decimal
 from typing import Optional
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -26,19 +25,19 @@ class ReceivingStatsCreate(BaseModel):
     tgt: Optional[int] = Field(None, ge=0, description="Targets")
     rec: Optional[int] = Field(None, ge=0, description="Receptions")
     yds: Optional[int] = Field(None, ge=0, description="Receiving yards")
-    ypr: Optional[Decimal] = Field(None, ge=0, description="Yards per reception")
+    ypr: Optional[float] = Field(None, ge=0, description="Yards per reception")
     td: Optional[int] = Field(None, ge=0, description="Touchdowns")
     first_downs: Optional[int] = Field(None, ge=0, description="First downs")
-    succ_pct: Optional[Decimal] = Field(
+    succ_pct: Optional[float] = Field(
         None, ge=0, le=100, description="Success percentage"
     )
     lng: Optional[int] = Field(None, ge=0, description="Longest reception")
-    rpg: Optional[Decimal] = Field(None, ge=0, description="Receptions per game")
-    ypg: Optional[Decimal] = Field(None, ge=0, description="Yards per game")
-    catch_pct: Optional[Decimal] = Field(
+    rpg: Optional[float] = Field(None, ge=0, description="Receptions per game")
+    ypg: Optional[float] = Field(None, ge=0, description="Yards per game")
+    catch_pct: Optional[float] = Field(
         None, ge=0, le=100, description="Catch percentage"
     )
-    ypt: Optional[Decimal] = Field(None, ge=0, description="Yards per target")
+    ypt: Optional[float] = Field(None, ge=0, description="Yards per target")
     fmb: Optional[int] = Field(None, ge=0, description="Fumbles")
 
 
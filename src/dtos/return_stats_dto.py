@@ -2,7 +2,6 @@
 DTOs for return stats operations.
 """
 
-from decimal import Decimal
 from typing import Optional
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -27,15 +26,13 @@ class ReturnStatsCreate(BaseModel):
     pr_yds: Optional[int] = Field(None, ge=0, description="Punt return yards")
     pr_td: Optional[int] = Field(None, ge=0, description="Punt return touchdowns")
     pr_lng: Optional[int] = Field(None, ge=0, description="Longest punt return")
-    pr_ypr: Optional[Decimal] = Field(None, ge=0, description="Yards per punt return")
+    pr_ypr: Optional[float] = Field(None, ge=0, description="Yards per punt return")
 
     kr: Optional[int] = Field(None, ge=0, description="Kickoff returns")
     kr_yds: Optional[int] = Field(None, ge=0, description="Kickoff return yards")
     kr_td: Optional[int] = Field(None, ge=0, description="Kickoff return touchdowns")
     kr_lng: Optional[int] = Field(None, ge=0, description="Longest kickoff return")
-    kr_ypr: Optional[Decimal] = Field(
-        None, ge=0, description="Yards per kickoff return"
-    )
+    kr_ypr: Optional[float] = Field(None, ge=0, description="Yards per kickoff return")
 
     apyd: Optional[int] = Field(None, ge=0, description="All-purpose yards")
     awards: Optional[str] = Field(None, max_length=128, description="Awards")
@@ -2,7 +2,6 @@
 DTOs for team returns operations.
 """
 
-from decimal import Decimal
 from typing import Optional
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -20,13 +19,13 @@ class TeamReturnsCreate(BaseModel):
     yds_punt: Optional[int] = Field(None, ge=0, description="Punt return yards")
     td_punt: Optional[int] = Field(None, ge=0, description="Punt return touchdowns")
     lng_punt: Optional[int] = Field(None, ge=0, description="Longest punt return")
-    ypr_punt: Optional[Decimal] = Field(None, ge=0, description="Yards per punt return")
+    ypr_punt: Optional[float] = Field(None, ge=0, description="Yards per punt return")
 
     ret_kick: Optional[int] = Field(None, ge=0, description="Kickoff returns")
     yds_kick: Optional[int] = Field(None, ge=0, description="Kickoff return yards")
     td_kick: Optional[int] = Field(None, ge=0, description="Kickoff return touchdowns")
     lng_kick: Optional[int] = Field(None, ge=0, description="Longest kickoff return")
-    ypr_kick: Optional[Decimal] = Field(
+    ypr_kick: Optional[float] = Field(
         None, ge=0, description="Yards per kickoff return"
     )
 
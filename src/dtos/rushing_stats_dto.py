@@ -2,7 +2,6 @@
 DTOs for rushing stats operations.
 """
 
-from decimal import Decimal
 from typing import Optional
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -27,13 +26,13 @@ class RushingStatsCreate(BaseModel):
     yds: Optional[int] = Field(None, ge=0, description="Rushing yards")
     td: Optional[int] = Field(None, ge=0, description="Touchdowns")
     first_downs: Optional[int] = Field(None, ge=0, description="First downs")
-    succ_pct: Optional[Decimal] = Field(
+    succ_pct: Optional[float] = Field(
         None, ge=0, le=100, description="Success percentage"
     )
     lng: Optional[int] = Field(None, ge=0, description="Longest rush")
-    ypa: Optional[Decimal] = Field(None, ge=0, description="Yards per attempt")
-    ypg: Optional[Decimal] = Field(None, ge=0, description="Yards per game")
-    apg: Optional[Decimal] = Field(None, ge=0, description="Attempts per game")
+    ypa: Optional[float] = Field(None, ge=0, description="Yards per attempt")
+    ypg: Optional[float] = Field(None, ge=0, description="Yards per game")
+    apg: Optional[float] = Field(None, ge=0, description="Attempts per game")
     fmb: Optional[int] = Field(None, ge=0, description="Fumbles")
     awards: Optional[str] = Field(None, max_length=128, description="Awards")
 
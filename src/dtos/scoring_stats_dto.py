@@ -2,7 +2,6 @@
 DTOs for scoring stats operations.
 """
 
-from decimal import Decimal
 from typing import Optional
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -45,7 +44,7 @@ class ScoringStatsCreate(BaseModel):
     fga: Optional[int] = Field(None, ge=0, description="Field goal attempts")
     sfty: Optional[int] = Field(None, ge=0, description="Safeties")
     pts: Optional[int] = Field(None, ge=0, description="Total points")
-    pts_pg: Optional[Decimal] = Field(None, ge=0, description="Points per game")
+    pts_pg: Optional[float] = Field(None, ge=0, description="Points per game")
     awards: Optional[str] = Field(None, max_length=128, description="Awards")
 
 
@@ -2,7 +2,6 @@
 DTOs for standings operations.
 """
 
-from decimal import Decimal
 from typing import Optional
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -16,15 +15,15 @@ class StandingsCreate(BaseModel):
     w: Optional[int] = Field(None, ge=0, description="Wins")
     l: Optional[int] = Field(None, ge=0, description="Losses")  # noqa: E741
     t: Optional[int] = Field(None, ge=0, description="Ties")
-    win_pct: Optional[Decimal] = Field(None, ge=0, le=1, description="Win percentage")
+    win_pct: Optional[float] = Field(None, ge=0, le=1, description="Win percentage")
     pf: Optional[int] = Field(None, ge=0, description="Points for")
     pa: Optional[int] = Field(None, ge=0, description="Points against")
     pd: Optional[int] = Field(None, description="Point differential")
-    mov: Optional[Decimal] = Field(None, description="Margin of victory")
-    sos: Optional[Decimal] = Field(None, description="Strength of schedule")
-    srs: Optional[Decimal] = Field(None, description="Simple rating system")
-    osrs: Optional[Decimal] = Field(None, description="Offensive SRS")
-    dsrs: Optional[Decimal] = Field(None, description="Defensive SRS")
+    mov: Optional[float] = Field(None, description="Margin of victory")
+    sos: Optional[float] = Field(None, description="Strength of schedule")
+    srs: Optional[float] = Field(None, description="Simple rating system")
+    osrs: Optional[float] = Field(None, description="Offensive SRS")
+    dsrs: Optional[float] = Field(None, description="Defensive SRS")
 
 
 class StandingsResponse(StandingsCreate):
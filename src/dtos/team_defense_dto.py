@@ -2,7 +2,6 @@
 DTOs for team defense operations.
 """
 
-from decimal import Decimal
 from typing import Optional
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -18,7 +17,7 @@ class TeamDefenseCreate(BaseModel):
     pa: Optional[int] = Field(None, ge=0, description="Points allowed")
     yds: Optional[int] = Field(None, ge=0, description="Total yards allowed")
     ply: Optional[int] = Field(None, ge=0, description="Plays faced")
-    ypp: Optional[Decimal] = Field(None, ge=0, description="Yards per play allowed")
+    ypp: Optional[float] = Field(None, ge=0, description="Yards per play allowed")
     turnovers: Optional[int] = Field(None, ge=0, description="Takeaways")
     fl: Optional[int] = Field(None, ge=0, description="Fumbles recovered")
     firstd_total: Optional[int] = Field(None, ge=0, description="First downs allowed")
@@ -28,7 +27,7 @@ class TeamDefenseCreate(BaseModel):
     yds_pass: Optional[int] = Field(None, ge=0, description="Passing yards allowed")
     td_pass: Optional[int] = Field(None, ge=0, description="Passing TDs allowed")
     ints: Optional[int] = Field(None, ge=0, description="Interceptions made")
-    nypa: Optional[Decimal] = Field(
+    nypa: Optional[float] = Field(
         None, ge=0, description="Net yards per pass attempt allowed"
     )
     firstd_pass: Optional[int] = Field(
@@ -38,7 +37,7 @@ class TeamDefenseCreate(BaseModel):
     att_rush: Optional[int] = Field(None, ge=0, description="Rush attempts faced")
     yds_rush: Optional[int] = Field(None, ge=0, description="Rushing yards allowed")
     td_rush: Optional[int] = Field(None, ge=0, description="Rushing TDs allowed")
-    ypa: Optional[Decimal] = Field(None, ge=0, description="Yards per rush allowed")
+    ypa: Optional[float] = Field(None, ge=0, description="Yards per rush allowed")
     firstd_rush: Optional[int] = Field(
         None, ge=0, description="First downs allowed via rush"
     )
@@ -48,15 +47,13 @@ class TeamDefenseCreate(BaseModel):
     firstpy: Optional[int] = Field(
         None, ge=0, description="First downs allowed via penalty"
     )
-    sc_pct: Optional[Decimal] = Field(
+    sc_pct: Optional[float] = Field(
         None, ge=0, le=100, description="Scoring percentage allowed"
     )
-    to_pct: Optional[Decimal] = Field(
+    to_pct: Optional[float] = Field(
         None, ge=0, le=100, description="Turnover percentage forced"
     )
-    depa: Optional[Decimal] = Field(
-        None, description="Defensive expected points allowed"
-    )
+    depa: Optional[float] = Field(None, description="Defensive expected points allowed")
 
 
 class TeamDefenseResponse(TeamDefenseCreate):
@@ -2,7 +2,6 @@
 DTOs for team offense operations.
 """
 
-from decimal import Decimal
 from typing import Optional
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -18,7 +17,7 @@ class TeamOffenseCreate(BaseModel):
     pf: Optional[int] = Field(None, ge=0, description="Points for")
     yds: Optional[int] = Field(None, ge=0, description="Total yards")
     ply: Optional[int] = Field(None, ge=0, description="Total plays")
-    ypp: Optional[Decimal] = Field(None, ge=0, description="Yards per play")
+    ypp: Optional[float] = Field(None, ge=0, description="Yards per play")
     turnovers: Optional[int] = Field(None, ge=0, description="Turnovers")
     fl: Optional[int] = Field(None, ge=0, description="Fumbles lost")
     firstd_total: Optional[int] = Field(None, ge=0, description="First downs total")
@@ -28,27 +27,25 @@ class TeamOffenseCreate(BaseModel):
     yds_pass: Optional[int] = Field(None, ge=0, description="Passing yards")
     td_pass: Optional[int] = Field(None, ge=0, description="Passing touchdowns")
     ints: Optional[int] = Field(None, ge=0, description="Interceptions")
-    nypa: Optional[Decimal] = Field(
-        None, ge=0, description="Net yards per pass attempt"
-    )
+    nypa: Optional[float] = Field(None, ge=0, description="Net yards per pass attempt")
     firstd_pass: Optional[int] = Field(None, ge=0, description="First downs by passing")
 
     att_rush: Optional[int] = Field(None, ge=0, description="Rush attempts")
     yds_rush: Optional[int] = Field(None, ge=0, description="Rushing yards")
     td_rush: Optional[int] = Field(None, ge=0, description="Rushing touchdowns")
-    ypa: Optional[Decimal] = Field(None, ge=0, description="Yards per rush attempt")
+    ypa: Optional[float] = Field(None, ge=0, description="Yards per rush attempt")
     firstd_rush: Optional[int] = Field(None, ge=0, description="First downs by rushing")
 
     pen: Optional[int] = Field(None, ge=0, description="Penalties")
     yds_pen: Optional[int] = Field(None, ge=0, description="Penalty yards")
     firstpy: Optional[int] = Field(None, ge=0, description="First downs by penalty")
-    sc_pct: Optional[Decimal] = Field(
+    sc_pct: Optional[float] = Field(
         None, ge=0, le=100, description="Scoring percentage"
     )
-    to_pct: Optional[Decimal] = Field(
+    to_pct: Optional[float] = Field(
         None, ge=0, le=100, description="Turnover percentage"
     )
-    opea: Optional[Decimal] = Field(None, description="Offensive expected points added")
+    opea: Optional[float] = Field(None, description="Offensive expected points added")
 
 
 class TeamOffenseResponse(TeamOffenseCreate):
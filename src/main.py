@@ -19,6 +19,7 @@ from src.services import (
     punting_stats_service,
     return_stats_service,
     scoring_stats_service,
+    shared_page_service,
 )
 
 app = FastAPI(title="beat-books-data", version="0.1.0")
@@ -47,6 +48,14 @@ class StatType(str, Enum):
     scoring_stats = "scoring_stats"
 
 
+class SharedPage(str, Enum):
+    """PFR pages whose player and team stats can be scraped in one fetch."""
+
+    kicking = "kicking"
+    punting = "punting"
+    returns = "returns"
+
+
 SCRAPE_DISPATCH = {
     StatType.team_offense: team_offense_service.scrape_and_store_team_offense,
     StatType.team_defense: team_defense_service.scrape_and_store,
@@ -87,6 +96,22 @@ async def scrape_team_gamelog(team: str, year: int):
     return data
 
 
+@app.get("/scrape/page/{page}/{season}")
+async def scrape_shared_page(page: SharedPage, season: int):
+    """
+    Scrape the player and team stats that share one PFR page.
+
+    Args:
+        page: The PFR page to scrape (kicking, punting or returns).
+        season: The NFL season year.
+
+    Returns:
+        dict: The saved "players" and "teams" records.
+    """
+    data = await shared_page_service.scrape_and_store(season, page.value)
+    return data
+
+
 @app.get("/scrape/{stat_type}/{season}")
 async def scrape_stat(stat_type: StatType, season: int):
     """
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from bs4 import Tag
@@ -5,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from src.core.database import SessionLocal
 from src.core.scraper_utils import (
+    build_cell_mapper,
     clean_value,
     fetch_page_with_selenium,
     find_pfr_table,
@@ -31,6 +33,8 @@ COLUMN_MAP = {
     "to_lose": "to_l",
 }
 
+_map_cells = build_cell_mapper(COLUMN_MAP)
+
 
 def get_dataframe(season: int) -> list[dict]:
     url = PFR_URL_TEMPLATE.format(season=season)
@@ -63,7 +67,10 @@ def get_dataframe(season: int) -> list[dict]:
         except ValueError:
             continue
 
-        row = {"week": clean_value(week_text)}
+        # Mapped cells first: the mapper pre-fills every COLUMN_MAP field
+        # (week included, since week_num is a <th>) with None.
+        row = _map_cells(cells)
+        row["week"] = clean_value(week_text)
 
         # Extract winner/loser from special cells
         winner_cell = tr.find("td", {"data-stat": "winner"})
@@ -80,11 +87,6 @@ def get_dataframe(season: int) -> list[dict]:
         if game_time_cell:
             row["kickoff_time"] = clean_value(game_time_cell.text.strip())
 
-        for cell in cells:
-            data_stat = cell.get("data-stat")
-            if data_stat and data_stat in COLUMN_MAP:
-                row[COLUMN_MAP[data_stat]] = clean_value(cell.text.strip())
-
         row["season"] = season
         rows.append(row)
 
@@ -95,7 +97,7 @@ async def scrape_and_store(season: int):
     db: Session = SessionLocal()
 
     try:
-        parsed = get_dataframe(season)
+        parsed = await asyncio.to_thread(get_dataframe, season)
         repo = GamesRepository(db)
 
         saved = []
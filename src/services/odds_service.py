@@ -9,6 +9,20 @@ from src.core.config import settings
 from src.dtos.odds_dto import OddsCreate
 from src.repositories.odds_repo import OddsRepository
 
+# Simplified mapping - should be more comprehensive.
+# TODO: Implement full mapping or load from database.
+TEAM_NAME_TO_ABBR = {
+    "Kansas City Chiefs": "KC",
+    "Baltimore Ravens": "BAL",
+    "San Francisco 49ers": "SF",
+    "Philadelphia Eagles": "PHI",
+    "Dallas Cowboys": "DAL",
+    "Buffalo Bills": "BUF",
+    "Miami Dolphins": "MIA",
+    "Detroit Lions": "DET",
+    # Add all 32 teams...
+}
+
 
 class OddsService:
     """
@@ -147,21 +161,8 @@ class OddsService:
     def _team_name_to_abbr(self, full_name: str) -> str:
         """
         Convert full team name to abbreviation.
-        TODO: Implement full mapping or load from database.
         """
-        # Simplified mapping - should be more comprehensive
-        team_map = {
-            "Kansas City Chiefs": "KC",
-            "Baltimore Ravens": "BAL",
-            "San Francisco 49ers": "SF",
-            "Philadelphia Eagles": "PHI",
-            "Dallas Cowboys": "DAL",
-            "Buffalo Bills": "BUF",
-            "Miami Dolphins": "MIA",
-            "Detroit Lions": "DET",
-            # Add all 32 teams...
-        }
-        return team_map.get(full_name, full_name[:3].upper())
+        return TEAM_NAME_TO_ABBR.get(full_name, full_name[:3].upper())
 
     async def fetch_and_store_current_odds(
         self, season: int, week: int, is_opening: bool = False, is_closing: bool = False
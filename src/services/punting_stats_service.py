@@ -1,10 +1,14 @@
+import asyncio
 import logging
+from typing import Optional
 
 from bs4 import Tag
 from sqlalchemy.orm import Session
 
 from src.core.database import SessionLocal
 from src.core.scraper_utils import (
+    build_cell_mapper,
+    clean_player_name,
     clean_value,
     fetch_page_with_selenium,
     find_pfr_table,
@@ -41,6 +45,8 @@ COLUMN_MAP = {
     "awards": "awards",
 }
 
+_map_cells = build_cell_mapper(COLUMN_MAP)
+
 
 def get_dataframe(season: int) -> list[dict]:
     url = PFR_URL_TEMPLATE.format(season=season)
@@ -52,6 +58,10 @@ def get_dataframe(season: int) -> list[dict]:
 
     assert isinstance(table, Tag)
 
+    return parse_table(table, season)
+
+
+def parse_table(table: Tag, season: int) -> list[dict]:
     rows = []
     for tr in table.find_all("tr"):
         if "class" in tr.attrs and "thead" in tr["class"]:
@@ -61,18 +71,11 @@ def get_dataframe(season: int) -> list[dict]:
         if not cells:
             continue
 
-        player_cell = tr.find("td", {"data-stat": "player"})
-        if not player_cell or not player_cell.text.strip():
+        row = _map_cells(cells)
+        if not row["player_name"]:
             continue
 
-        row = {}
-        for cell in cells:
-            data_stat = cell.get("data-stat")
-            if data_stat and data_stat in COLUMN_MAP:
-                row[COLUMN_MAP[data_stat]] = clean_value(cell.text.strip())
-
-        if "player_name" in row and row["player_name"]:
-            row["player_name"] = row["player_name"].rstrip("*+")
+        row["player_name"] = clean_player_name(row["player_name"])
 
         rk_cell = tr.find("th", {"data-stat": "ranker"})
         if rk_cell and rk_cell.text.strip():
@@ -84,11 +87,12 @@ def get_dataframe(season: int) -> list[dict]:
     return rows
 
 
-async def scrape_and_store(season: int):
+async def scrape_and_store(season: int, parsed: Optional[list[dict]] = None):
     db: Session = SessionLocal()
 
     try:
-        parsed = get_dataframe(season)
+        if parsed is None:
+            parsed = await asyncio.to_thread(get_dataframe, season)
         repo = PuntingStatsRepository(db)
 
         saved = []
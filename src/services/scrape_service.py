@@ -1,3 +1,4 @@
+import asyncio
 import time
 import base64
 import logging
@@ -15,6 +16,7 @@ from src.repositories.team_game_repo import TeamGameRepository
 from src.core.database import SessionLocal
 from src.core.config import settings
 from src.core.scraper_utils import (
+    _selenium_fetch_lock,
     strip_url_hash,
     get_random_user_agent,
     get_random_proxy,
@@ -200,6 +202,75 @@ def map_scraped_to_model(scraped: dict, season: int) -> TeamGameCreate:
     )
 
 
+def _fetch_gamelog_excel_bytes(url: str) -> bytes:
+    """
+    Drive the team page's "Get as Excel Workbook" export and return its bytes.
+
+    Holds the shared Selenium fetch lock for the whole driver session, so a
+    gamelog download never overlaps a stat scrape running in a worker thread.
+    """
+    with _selenium_fetch_lock:
+        time.sleep(settings.SCRAPE_DELAY_SECONDS)
+
+        options = Options()
+        options.add_argument("--headless=new")
+
+        # Set random user-agent from pool
+        user_agent = get_random_user_agent()
+        options.add_argument(f"user-agent={user_agent}")
+        logger.debug(f"Using user-agent: {user_agent[:50]}...")
+
+        # Configure proxy if enabled
+        proxy = get_random_proxy()
+        if proxy:
+            options.add_argument(f"--proxy-server={proxy}")
+            logger.debug(f"Using proxy: {proxy}")
+
+        driver = webdriver.Chrome(
+            service=Service(ChromeDriverManager().install()),
+            options=options,
+        )
+
+        # Set page load timeout
+        driver.set_page_load_timeout(settings.SCRAPE_REQUEST_TIMEOUT)
+
+        try:
+            driver.get(url)
+            time.sleep(1)
+
+            # Scroll to the Schedule section
+            section = driver.find_element(
+                By.XPATH, "//h2[contains(text(), 'Schedule')]/parent::div"
+            )
+            driver.execute_script("arguments[0].scrollIntoView(true);", section)
+            time.sleep(1)
+
+            # Click "Share & more"
+            share = section.find_element(
+                By.XPATH,
+                ".//li[contains(@class, 'hasmore')]/span[contains(text(),'Share')]",
+            )
+            share.click()
+            time.sleep(0.4)
+
+            # Click "Get as Excel Workbook"
+            excel_btn = section.find_element(
+                By.XPATH, ".//button[contains(text(),'Get as Excel Workbook')]"
+            )
+            excel_btn.click()
+            time.sleep(1)
+
+            # Extract Excel bytes from injected <a id="dlink">
+            excel_bytes = extract_excel_bytes_from_dlink(driver)
+        finally:
+            driver.quit()
+
+    print("=== FIRST 200 BYTES ===")
+    print(excel_bytes[:200])
+    print("=======================")
+    return excel_bytes
+
+
 async def download_team_gamelog(team: str, year: int):
     url = f"https://www.pro-football-reference.com/teams/{team.lower()}/{year}.htm"
 
@@ -209,59 +280,9 @@ async def download_team_gamelog(team: str, year: int):
         logger.info(f"Stripped hash fragment from URL: {url} -> {clean_url}")
         url = clean_url
 
-    options = Options()
-    options.add_argument("--headless=new")
-
-    # Set random user-agent from pool
-    user_agent = get_random_user_agent()
-    options.add_argument(f"user-agent={user_agent}")
-    logger.debug(f"Using user-agent: {user_agent[:50]}...")
-
-    # Configure proxy if enabled
-    proxy = get_random_proxy()
-    if proxy:
-        options.add_argument(f"--proxy-server={proxy}")
-        logger.debug(f"Using proxy: {proxy}")
-
-    driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
-        options=options,
-    )
-
-    # Set page load timeout
-    driver.set_page_load_timeout(settings.SCRAPE_REQUEST_TIMEOUT)
-
-    driver.get(url)
-    time.sleep(1)
-
-    # Scroll to the Schedule section
-    section = driver.find_element(
-        By.XPATH, "//h2[contains(text(), 'Schedule')]/parent::div"
-    )
-    driver.execute_script("arguments[0].scrollIntoView(true);", section)
-    time.sleep(1)
-
-    # Click "Share & more"
-    share = section.find_element(
-        By.XPATH, ".//li[contains(@class, 'hasmore')]/span[contains(text(),'Share')]"
-    )
-    share.click()
-    time.sleep(0.4)
-
-    # Click "Get as Excel Workbook"
-    excel_btn = section.find_element(
-        By.XPATH, ".//button[contains(text(),'Get as Excel Workbook')]"
-    )
-    excel_btn.click()
-    time.sleep(1)
-
-    # Extract Excel bytes from injected <a id="dlink">
-    excel_bytes = extract_excel_bytes_from_dlink(driver)
-    print("=== FIRST 200 BYTES ===")
-    print(excel_bytes[:200])
-    print("=======================")
-
-    driver.quit()
+    # The driver session blocks (and may wait on the fetch lock), so keep it
+    # off the event loop like the stat scrapes.
+    excel_bytes = await asyncio.to_thread(_fetch_gamelog_excel_bytes, url)
 
     # Parse direct bytes into Python objects
     return parse_xlsx_to_games(excel_bytes, team)
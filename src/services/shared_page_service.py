@@ -0,0 +1,82 @@
+"""
+Scrape the player and team stats that come from the same PFR page.
+
+kicking.htm, punting.htm and returns.htm each feed a player-stats service
+and a team service. Scraping a pair through here fetches and parses the
+page once and hands each service its rows, instead of each service
+fetching the page on its own.
+"""
+
+import asyncio
+import logging
+
+from src.core.scraper_utils import (
+    fetch_page_with_selenium,
+    find_pfr_tables,
+    retry_with_backoff,
+)
+from src.services import (
+    kicking_stats_service,
+    kicking_team_service,
+    punting_stats_service,
+    punting_team_service,
+    return_stats_service,
+    returns_team_service,
+)
+
+logger = logging.getLogger(__name__)
+
+# Page name -> (player-stats service, team service) reading that page.
+PAGE_PAIRS = {
+    "kicking": (kicking_stats_service, kicking_team_service),
+    "punting": (punting_stats_service, punting_team_service),
+    "returns": (return_stats_service, returns_team_service),
+}
+
+
+def get_dataframes(season: int, page: str) -> tuple[list[dict], list[dict]]:
+    """
+    Fetch one PFR page and parse both services' rows from it.
+
+    Args:
+        season: The NFL season year
+        page: Key into PAGE_PAIRS
+
+    Returns:
+        Tuple of (player rows, team rows)
+    """
+    player_service, team_service = PAGE_PAIRS[page]
+    url = player_service.PFR_URL_TEMPLATE.format(season=season)
+    page_source = retry_with_backoff(fetch_page_with_selenium, url, url=url)
+    tables = find_pfr_tables(
+        page_source, {player_service.PFR_TABLE_ID, team_service.PFR_TABLE_ID}
+    )
+
+    parsed = []
+    for service in (player_service, team_service):
+        table = tables[service.PFR_TABLE_ID]
+        if table is None:
+            raise Exception(f"Could not find {service.PFR_TABLE_ID} table")
+        parsed.append(service.parse_table(table, season))
+
+    return parsed[0], parsed[1]
+
+
+async def scrape_and_store(season: int, page: str) -> dict:
+    """
+    Scrape a page once and store its player and team rows.
+
+    Args:
+        season: The NFL season year
+        page: Key into PAGE_PAIRS
+
+    Returns:
+        Dict with the saved "players" and "teams" records
+    """
+    player_service, team_service = PAGE_PAIRS[page]
+    player_rows, team_rows = await asyncio.to_thread(get_dataframes, season, page)
+
+    return {
+        "players": await player_service.scrape_and_store(season, player_rows),
+        "teams": await team_service.scrape_and_store(season, team_rows),
+    }
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from bs4 import Tag
@@ -5,9 +6,9 @@ from sqlalchemy.orm import Session
 
 from src.core.database import SessionLocal
 from src.core.scraper_utils import (
-    clean_value,
+    build_cell_mapper,
     fetch_page_with_selenium,
-    find_pfr_table,
+    find_pfr_tables,
     retry_with_backoff,
 )
 from src.entities.standings import Standings
@@ -35,6 +36,8 @@ COLUMN_MAP = {
     "srs_defense": "dsrs",
 }
 
+_map_cells = build_cell_mapper(COLUMN_MAP)
+
 
 def _parse_table(table: Tag, season: int) -> list[dict]:
     rows = []
@@ -46,19 +49,12 @@ def _parse_table(table: Tag, season: int) -> list[dict]:
         if not cells:
             continue
 
-        tm_cell = tr.find("td", {"data-stat": "team"})
-        if not tm_cell or not tm_cell.text.strip():
+        row = _map_cells(cells)
+        if not row["tm"]:
             continue
 
-        row = {}
-        for cell in cells:
-            data_stat = cell.get("data-stat")
-            if data_stat and data_stat in COLUMN_MAP:
-                row[COLUMN_MAP[data_stat]] = clean_value(cell.text.strip())
-
         # Clean team name - remove special characters like * (playoff indicator)
-        if "tm" in row and row["tm"]:
-            row["tm"] = row["tm"].rstrip("*+")
+        row["tm"] = row["tm"].rstrip("*+")
 
         row["season"] = season
         rows.append(row)
@@ -70,9 +66,11 @@ def get_dataframe(season: int) -> list[dict]:
     url = PFR_URL_TEMPLATE.format(season=season)
     page_source = retry_with_backoff(fetch_page_with_selenium, url, url=url)
 
+    tables = find_pfr_tables(page_source, PFR_TABLE_IDS)
+
     all_rows = []
     for table_id in PFR_TABLE_IDS:
-        table = find_pfr_table(page_source, table_id)
+        table = tables[table_id]
         if table is None:
             logger.warning(f"Could not find {table_id} table for season {season}")
             continue
@@ -89,7 +87,7 @@ async def scrape_and_store(season: int):
     db: Session = SessionLocal()
 
     try:
-        parsed = get_dataframe(season)
+        parsed = await asyncio.to_thread(get_dataframe, season)
         repo = StandingsRepository(db)
 
         saved = []
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from bs4 import Tag
@@ -5,7 +6,7 @@ from sqlalchemy.orm import Session
 
 from src.core.database import SessionLocal
 from src.core.scraper_utils import (
-    clean_value,
+    build_cell_mapper,
     fetch_page_with_selenium,
     find_pfr_table,
     retry_with_backoff,
@@ -49,6 +50,8 @@ COLUMN_MAP = {
     "exp_pts_def_tot": "depa",
 }
 
+_map_cells = build_cell_mapper(COLUMN_MAP)
+
 
 def get_dataframe(season: int) -> list[dict]:
     url = PFR_URL_TEMPLATE.format(season=season)
@@ -69,16 +72,10 @@ def get_dataframe(season: int) -> list[dict]:
         if not cells:
             continue
 
-        tm_cell = tr.find("td", {"data-stat": "team"})
-        if not tm_cell or not tm_cell.text.strip():
+        row = _map_cells(cells)
+        if not row["tm"]:
             continue
 
-        row = {}
-        for cell in cells:
-            data_stat = cell.get("data-stat")
-            if data_stat and data_stat in COLUMN_MAP:
-                row[COLUMN_MAP[data_stat]] = clean_value(cell.text.strip())
-
         row["season"] = season
         rows.append(row)
 
@@ -89,7 +86,7 @@ async def scrape_and_store(season: int):
     db: Session = SessionLocal()
 
     try:
-        parsed = get_dataframe(season)
+        parsed = await asyncio.to_thread(get_dataframe, season)
         repo = TeamDefenseRepository(db)
 
         saved = []
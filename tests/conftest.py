@@ -3,20 +3,141 @@ import os
 # Set DATABASE_URL before any src imports so Settings() doesn't fail during collection
 os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
 
+import importlib
+import pkgutil
+from contextlib import contextmanager
+
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, configure_mappers
+from sqlalchemy.pool import StaticPool
 
+import src.entities
+from src.core.config import settings
 from src.entities.base import Base
 
 
-@pytest.fixture
-def db_session():
-    """In-memory SQLite for unit tests. Never hits production DB."""
-    engine = create_engine("sqlite:///:memory:")
+@pytest.fixture(scope="session")
+def engine(worker_id):
+    """One in-memory SQLite engine for the whole run; schema is created once.
+
+    StaticPool hands every checkout the same DBAPI connection, so all
+    sessions see the same in-memory database. The database is also named
+    and shared-cache, so a connection opened outside the pool attaches to
+    the same schema instead of an empty one. The name carries the xdist
+    worker id ("master" when not distributed) so workers never share one.
+    """
+    engine = create_engine(
+        f"sqlite:///file:beat_books_test_{worker_id}"
+        "?mode=memory&cache=shared&uri=true",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite's own BEGIN handling breaks SAVEPOINT; let SQLAlchemy emit it.
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        # Test data is throwaway: skip durability work, keep temp data in
+        # RAM and give the page cache room (~20 MB) for the whole run.
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-20000")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # The schema is built once, so every entity must be registered on
+    # Base.metadata first, not just the ones the collected tests imported.
+    for module in pkgutil.iter_modules(src.entities.__path__):
+        importlib.import_module(f"src.entities.{module.name}")
+    # Configure all mappers now rather than on the first query of whichever
+    # test happens to run first on this worker.
+    configure_mappers()
+
     Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(engine):
+    """In-memory SQLite for unit tests. Never hits production DB.
+
+    Each test runs inside an outer transaction that is rolled back on
+    teardown; repository commits only release a SAVEPOINT.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
     yield session
     session.close()
-    engine.dispose()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def settings_override(monkeypatch):
+    """Override attributes on the shared settings object for one test."""
+
+    def _override(**values):
+        for name, value in values.items():
+            monkeypatch.setattr(settings, name, value)
+
+    return _override
+
+
+@pytest.fixture(scope="session")
+def serve_pfr_page():
+    """Context manager that points a module's page fetch at canned HTML.
+
+    ``with serve_pfr_page(service, html) as urls:`` patches
+    ``service.fetch_page_with_selenium`` to return html and records each
+    requested URL in urls. Session-scoped so module-scoped parse fixtures
+    can use it.
+    """
+
+    @contextmanager
+    def serve(module, html):
+        urls = []
+
+        def fetch(url):
+            urls.append(url)
+            return html
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(module, "fetch_page_with_selenium", fetch)
+            yield urls
+
+    return serve
+
+
+@pytest.fixture(scope="session")
+def _client():
+    """One TestClient (and app lifespan) for the whole run."""
+    from src.main import app
+
+    with TestClient(app, raise_server_exceptions=False) as tc:
+        yield tc
+
+
+@pytest.fixture
+def client(_client):
+    """FastAPI TestClient; shared across tests since it holds no per-test state."""
+    return _client
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup(engine, _client):
+    """Do the one-off session setup before the first test.
+
+    That is: build the engine and schema, configure the ORM mappers, and
+    import src.main and enter the app lifespan. Otherwise whichever test
+    first asks for them pays the setup cost, which skews per-test timings.
+    """
@@ -0,0 +1,77 @@
+"""
+Unit tests for the games scrape service.
+
+The page fetch is patched out; parsing runs for real against a small
+PFR-style games table.
+"""
+
+import pytest
+
+from src.services import games_service
+from src.services.games_service import get_dataframe
+
+SAMPLE_PFR_HTML = """
+<html><body>
+<table id="games">
+<thead><tr><th data-stat="week_num">Week</th><td data-stat="winner">Winner</td></tr></thead>
+<tbody>
+<tr>
+<th data-stat="week_num">1</th>
+<td data-stat="game_day_of_week">Thu</td>
+<td data-stat="game_date">2023-09-07</td>
+<td data-stat="gametime">8:20PM</td>
+<td data-stat="winner">Detroit Lions</td>
+<td data-stat="game_location">@</td>
+<td data-stat="loser">Kansas City Chiefs</td>
+<td data-stat="boxscore_word">boxscore</td>
+<td data-stat="pts_win">21</td>
+<td data-stat="pts_lose">20</td>
+<td data-stat="yards_win">368</td>
+<td data-stat="to_win">1</td>
+<td data-stat="yards_lose">316</td>
+<td data-stat="to_lose">1</td>
+</tr>
+<tr class="thead"><th data-stat="week_num">Week</th><td data-stat="winner">Winner</td></tr>
+<tr><th data-stat="week_num">Playoffs</th><td data-stat="winner"></td></tr>
+</tbody>
+</table>
+</body></html>
+"""
+
+
+@pytest.fixture(scope="module")
+def sample_rows(serve_pfr_page):
+    """SAMPLE_PFR_HTML parsed by get_dataframe once per module."""
+    with serve_pfr_page(games_service, SAMPLE_PFR_HTML):
+        return get_dataframe(2023)
+
+
+class TestGetDataframe:
+    """Tests for parsing the PFR games table into row dicts."""
+
+    def test_skips_header_and_non_numeric_weeks(self, sample_rows):
+        """Test that only the numbered-week game row is kept."""
+        assert len(sample_rows) == 1
+
+    def test_week_comes_from_header_cell(self, sample_rows):
+        """Test that week_num, a <th>, is not reset by the mapped cells."""
+        assert sample_rows[0]["week"] == "1"
+
+    def test_maps_game_fields(self, sample_rows):
+        """Test that special and COLUMN_MAP cells both land in the row."""
+        assert sample_rows[0] == {
+            "week": "1",
+            "game_day": "Thu",
+            "game_date": "2023-09-07",
+            "kickoff_time": "8:20PM",
+            "winner": "Detroit Lions",
+            "loser": "Kansas City Chiefs",
+            "boxscore": "boxscore",
+            "pts_w": "21",
+            "pts_l": "20",
+            "yds_w": "368",
+            "to_w": "1",
+            "yds_l": "316",
+            "to_l": "1",
+            "season": 2023,
+        }
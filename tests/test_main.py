@@ -0,0 +1,92 @@
+"""Tests for the FastAPI routes in src.main."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.main import StatType
+
+
+@pytest.fixture
+def mock_scrape_dispatch():
+    """Swap the team_offense scrape function for an AsyncMock."""
+    mock_fn = AsyncMock(return_value=[])
+    with patch.dict(
+        "src.main.SCRAPE_DISPATCH", {StatType.team_offense: mock_fn}, clear=False
+    ):
+        yield mock_fn
+
+
+class TestHealth:
+    """Tests for the health and root endpoints."""
+
+    @pytest.mark.parametrize(
+        "url, check",
+        [
+            (
+                "/health",
+                lambda body: body["status"] == "healthy"
+                and body["service"] == "beat-books-data",
+            ),
+            ("/", lambda body: body == {"Hello": "World"}),
+        ],
+        ids=["health", "root"],
+    )
+    def test_endpoint_responds(self, client, url, check):
+        """Test that each static endpoint returns 200 with the expected body."""
+        resp = client.get(url)
+
+        assert resp.status_code == 200
+        assert check(resp.json())
+
+
+class TestScrapeStat:
+    """Tests for the /scrape/{stat_type}/{season} dispatch route."""
+
+    def test_dispatches_to_service(self, client, mock_scrape_dispatch):
+        """Test that the route awaits the scrape function for the stat type."""
+        resp = client.get("/scrape/team_offense/2023")
+
+        assert resp.status_code == 200
+        assert resp.json() == []
+        mock_scrape_dispatch.assert_awaited_once_with(2023)
+
+    def test_returns_service_result(self, client, mock_scrape_dispatch):
+        """Test that the scrape function's result is returned as the body."""
+        mock_scrape_dispatch.return_value = [{"tm": "KAN", "season": 2023}]
+
+        resp = client.get("/scrape/team_offense/2023")
+
+        assert resp.json() == [{"tm": "KAN", "season": 2023}]
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/scrape/not_a_stat/2023",  # stat type outside the StatType enum
+            "/scrape/team_offense/latest",  # non-integer season
+        ],
+    )
+    def test_invalid_path_rejected(self, client, path):
+        """Test that malformed scrape paths are rejected with a 422."""
+        resp = client.get(path)
+
+        assert resp.status_code == 422
+
+
+class TestScrapeSharedPage:
+    """Tests for the /scrape/page/{page}/{season} route."""
+
+    def test_scrapes_page_pair(self, client, monkeypatch):
+        """Test that the route scrapes the named page's player/team pair."""
+        mock_fn = AsyncMock(return_value={"players": [], "teams": []})
+        monkeypatch.setattr("src.main.shared_page_service.scrape_and_store", mock_fn)
+
+        resp = client.get("/scrape/page/punting/2023")
+
+        assert resp.status_code == 200
+        assert resp.json() == {"players": [], "teams": []}
+        mock_fn.assert_awaited_once_with(2023, "punting")
+
+    def test_unknown_page_rejected(self, client):
+        """Test that a page outside SharedPage is rejected with a 422."""
+        assert client.get("/scrape/page/passing/2023").status_code == 422
@@ -5,44 +5,59 @@ from datetime import datetime, date
 from decimal import Decimal
 
 from src.entities.odds import Odds
-from src.entities.base import Base
 from src.dtos.odds_dto import OddsCreate
 from src.repositories.odds_repo import OddsRepository
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+# Built once at import; fixtures copy it into a fresh DTO per test.
+# These tests exercise the repository, not DTO validation (that lives in
+# test_dtos.py), and the values are already the right types, so the
+# fixtures build DTOs with model_construct and skip the validators.
+SAMPLE_ODDS_ROW = {
+    "season": 2024,
+    "week": 1,
+    "game_date": date(2024, 9, 8),
+    "home_team": "KC",
+    "away_team": "BAL",
+    "sportsbook": "DraftKings",
+    "spread_home": Decimal("-3.0"),
+    "spread_away": Decimal("3.0"),
+    "moneyline_home": -150,
+    "moneyline_away": 130,
+    "over_under": Decimal("47.5"),
+    "timestamp": datetime(2024, 9, 7, 10, 0, 0),
+    "is_opening": False,
+    "is_closing": True,
+}
+
+# The game/book/time identity of SAMPLE_ODDS_ROW, without any line values;
+# make_odds_dto starts from these so the two samples can't drift apart.
+ODDS_IDENTITY_KEYS = (
+    "season",
+    "week",
+    "game_date",
+    "home_team",
+    "away_team",
+    "sportsbook",
+    "timestamp",
+)
 
 
 @pytest.fixture
-def db_session():
-    """In-memory SQLite database for testing."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    yield session
-    session.close()
+def make_odds_dto():
+    """Factory for OddsCreate DTOs: a KC vs BAL DraftKings line plus overrides."""
+
+    def _make(**overrides):
+        base = {key: SAMPLE_ODDS_ROW[key] for key in ODDS_IDENTITY_KEYS}
+        base.update(overrides)
+        return OddsCreate.model_construct(**base)
+
+    return _make
 
 
 @pytest.fixture
 def sample_odds_dto():
     """Sample OddsCreate DTO for testing."""
-    return OddsCreate(
-        season=2024,
-        week=1,
-        game_date=date(2024, 9, 8),
-        home_team="KC",
-        away_team="BAL",
-        sportsbook="DraftKings",
-        spread_home=Decimal("-3.0"),
-        spread_away=Decimal("3.0"),
-        moneyline_home=-150,
-        moneyline_away=130,
-        over_under=Decimal("47.5"),
-        timestamp=datetime(2024, 9, 7, 10, 0, 0),
-        is_opening=False,
-        is_closing=True,
-    )
+    return OddsCreate.model_construct(**SAMPLE_ODDS_ROW)
 
 
 class TestOddsRepository:
@@ -111,21 +126,19 @@ class TestOddsRepository:
         assert len(closing) == 1
         assert closing[0].is_closing is True
 
-    def test_get_closing_lines_by_sportsbook(self, db_session, sample_odds_dto):
+    def test_get_closing_lines_by_sportsbook(
+        self, db_session, sample_odds_dto, make_odds_dto
+    ):
         """Test retrieving closing lines filtered by sportsbook."""
         OddsRepository.create(db_session, sample_odds_dto)
 
         # Create another with different sportsbook
-        other_dto = OddsCreate(
-            season=2024,
-            week=1,
-            game_date=date(2024, 9, 8),
+        other_dto = make_odds_dto(
             home_team="DAL",
             away_team="NYG",
             sportsbook="FanDuel",
             spread_home=Decimal("-7.0"),
             spread_away=Decimal("7.0"),
-            timestamp=datetime(2024, 9, 7, 10, 0, 0),
             is_closing=True,
         )
         OddsRepository.create(db_session, other_dto)
@@ -138,17 +151,10 @@ class TestOddsRepository:
         assert len(closing) == 1
         assert closing[0].sportsbook == "DraftKings"
 
-    def test_get_opening_lines(self, db_session):
+    def test_get_opening_lines(self, db_session, make_odds_dto):
         """Test retrieving opening lines."""
-        opening_dto = OddsCreate(
-            season=2024,
-            week=1,
-            game_date=date(2024, 9, 8),
-            home_team="KC",
-            away_team="BAL",
-            sportsbook="DraftKings",
-            timestamp=datetime(2024, 9, 1, 10, 0, 0),
-            is_opening=True,
+        opening_dto = make_odds_dto(
+            timestamp=datetime(2024, 9, 1, 10, 0, 0), is_opening=True
         )
         OddsRepository.create(db_session, opening_dto)
 
@@ -157,21 +163,21 @@ class TestOddsRepository:
         assert len(opening) == 1
         assert opening[0].is_opening is True
 
-    def test_get_line_movement(self, db_session):
+    def test_get_line_movement(self, db_session, make_odds_dto):
         """Test retrieving line movement history."""
-        # Create multiple timestamps for same game
-        for hour in [10, 12, 14]:
-            dto = OddsCreate(
-                season=2024,
-                week=1,
-                game_date=date(2024, 9, 8),
-                home_team="KC",
-                away_team="BAL",
-                sportsbook="DraftKings",
-                spread_home=Decimal(f"-{3 + hour * 0.1}"),
-                timestamp=datetime(2024, 9, 7, hour, 0, 0),
-            )
-            OddsRepository.create(db_session, dto)
+        # Seed multiple timestamps for same game; the rows are never touched
+        # again, so skip the unit of work and insert them in one batch.
+        db_session.bulk_insert_mappings(
+            Odds,
+            [
+                make_odds_dto(
+                    spread_home=Decimal(f"-{3 + hour * 0.1}"),
+                    timestamp=datetime(2024, 9, 7, hour, 0, 0),
+                ).model_dump()
+                for hour in [10, 12, 14]
+            ],
+        )
+        db_session.commit()
 
         movements = OddsRepository.get_line_movement(
             db_session, 2024, 1, "KC", "DraftKings"
@@ -194,28 +200,9 @@ class TestOddsRepository:
         odds = OddsRepository.get_by_team(db_session, "BAL", season=2024, week=1)
         assert len(odds) == 1
 
-    def test_bulk_create(self, db_session):
+    def test_bulk_create(self, db_session, make_odds_dto):
         """Test bulk insert of odds records."""
-        dtos = [
-            OddsCreate(
-                season=2024,
-                week=1,
-                game_date=date(2024, 9, 8),
-                home_team="KC",
-                away_team="BAL",
-                sportsbook="DraftKings",
-                timestamp=datetime(2024, 9, 7, 10, 0, 0),
-            ),
-            OddsCreate(
-                season=2024,
-                week=1,
-                game_date=date(2024, 9, 8),
-                home_team="DAL",
-                away_team="NYG",
-                sportsbook="DraftKings",
-                timestamp=datetime(2024, 9, 7, 10, 0, 0),
-            ),
-        ]
+        dtos = [make_odds_dto(), make_odds_dto(home_team="DAL", away_team="NYG")]
 
         created = OddsRepository.bulk_create(db_session, dtos)
 
@@ -1,85 +1,97 @@
 """Unit tests for odds service with mocked API responses."""
 
+import httpx
 import pytest
 from datetime import datetime, date, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, create_autospec, patch
 from decimal import Decimal
 
+from sqlalchemy.orm import Session
+
 from src.services.odds_service import OddsService
 from src.dtos.odds_dto import OddsCreate
 from src.entities.odds import Odds
 
-
-class TestOddsService:
-    """Test suite for OddsService business logic."""
-
-    @pytest.fixture
-    def mock_db_session(self):
-        """Mock database session."""
-        return MagicMock()
-
-    @pytest.fixture
-    def odds_service(self, mock_db_session):
-        """Create OddsService instance with mocked DB."""
-        return OddsService(mock_db_session)
-
-    @pytest.fixture
-    def sample_api_response(self):
-        """Sample response from The Odds API."""
-        return [
+# The Odds API payload shared by every test; read-only, so built once.
+SAMPLE_API_RESPONSE = [
+    {
+        "id": "game123",
+        "sport_key": "americanfootball_nfl",
+        "commence_time": "2024-09-08T20:00:00Z",
+        "home_team": "Kansas City Chiefs",
+        "away_team": "Baltimore Ravens",
+        "bookmakers": [
             {
-                "id": "game123",
-                "sport_key": "americanfootball_nfl",
-                "commence_time": "2024-09-08T20:00:00Z",
-                "home_team": "Kansas City Chiefs",
-                "away_team": "Baltimore Ravens",
-                "bookmakers": [
+                "key": "draftkings",
+                "title": "DraftKings",
+                "markets": [
                     {
-                        "key": "draftkings",
-                        "title": "DraftKings",
-                        "markets": [
+                        "key": "spreads",
+                        "outcomes": [
                             {
-                                "key": "spreads",
-                                "outcomes": [
-                                    {
-                                        "name": "Kansas City Chiefs",
-                                        "price": -110,
-                                        "point": -3.0,
-                                    },
-                                    {
-                                        "name": "Baltimore Ravens",
-                                        "price": -110,
-                                        "point": 3.0,
-                                    },
-                                ],
+                                "name": "Kansas City Chiefs",
+                                "price": -110,
+                                "point": -3.0,
                             },
                             {
-                                "key": "h2h",
-                                "outcomes": [
-                                    {"name": "Kansas City Chiefs", "price": -150},
-                                    {"name": "Baltimore Ravens", "price": 130},
-                                ],
-                            },
-                            {
-                                "key": "totals",
-                                "outcomes": [
-                                    {"name": "Over", "point": 47.5},
-                                    {"name": "Under", "point": 47.5},
-                                ],
+                                "name": "Baltimore Ravens",
+                                "price": -110,
+                                "point": 3.0,
                             },
                         ],
-                    }
+                    },
+                    {
+                        "key": "h2h",
+                        "outcomes": [
+                            {"name": "Kansas City Chiefs", "price": -150},
+                            {"name": "Baltimore Ravens", "price": 130},
+                        ],
+                    },
+                    {
+                        "key": "totals",
+                        "outcomes": [
+                            {"name": "Over", "point": 47.5},
+                            {"name": "Under", "point": 47.5},
+                        ],
+                    },
                 ],
             }
-        ]
+        ],
+    }
+]
+
+
+@pytest.fixture(scope="class")
+def mock_db_session():
+    """Autospecced database session, shared by the test class.
 
-    def test_parse_api_response_to_dtos(self, odds_service, sample_api_response):
+    The service only passes it through to the repository, so no magic
+    methods are needed.
+    """
+    return create_autospec(Session, instance=True)
+
+
+class TestOddsService:
+    """Test suite for OddsService business logic."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_db_session(self, mock_db_session):
+        """Clear recorded calls on the shared session before each test."""
+        mock_db_session.reset_mock()
+
+    @pytest.fixture
+    def odds_service(self, mock_db_session):
+        """Create OddsService instance with mocked DB."""
+        return OddsService(mock_db_session)
+
+    def test_parse_api_response_to_dtos(self, odds_service):
         """Test parsing API response into DTOs."""
         season = 2024
         week = 1
 
         dtos = odds_service.parse_api_response_to_dtos(
-            sample_api_response, season, week, is_closing=True
+            SAMPLE_API_RESPONSE, season, week, is_closing=True
         )
 
         assert len(dtos) == 1
@@ -97,27 +109,22 @@ class TestOddsService:
         assert dto.is_closing is True
         assert dto.is_opening is False
 
-    @pytest.mark.asyncio
-    async def test_fetch_odds_from_api_success(self, odds_service, sample_api_response):
+    async def test_fetch_odds_from_api_success(self, odds_service, respx_mock):
         """Test successful API fetch."""
         # Set api_key directly since it's captured at init time
         odds_service.api_key = "test_api_key"
         odds_service.base_url = "https://api.test.com"
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.json.return_value = sample_api_response
-            mock_response.raise_for_status = MagicMock()
+        route = respx_mock.get(
+            "https://api.test.com/v4/sports/americanfootball_nfl/odds"
+        ).mock(return_value=httpx.Response(200, json=SAMPLE_API_RESPONSE))
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
-
-            result = await odds_service.fetch_odds_from_api()
+        result = await odds_service.fetch_odds_from_api()
 
-            assert result == sample_api_response
+        assert result == SAMPLE_API_RESPONSE
+        assert route.call_count == 1
+        assert route.calls.last.request.url.params["apiKey"] == "test_api_key"
 
-    @pytest.mark.asyncio
     async def test_fetch_odds_from_api_no_key(self, odds_service):
         """Test API fetch fails without API key."""
         odds_service.api_key = ""
@@ -132,22 +139,17 @@ class TestOddsService:
         # Unknown team should return first 3 chars uppercase
         assert odds_service._team_name_to_abbr("Unknown Team") == "UNK"
 
-    @pytest.mark.asyncio
-    async def test_fetch_and_store_current_odds(
-        self, odds_service, sample_api_response, mock_db_session
-    ):
+    async def test_fetch_and_store_current_odds(self, odds_service, mock_db_session):
         """Test fetching and storing odds end-to-end."""
         season = 2024
         week = 1
 
         # Mock the API fetch
-        odds_service.fetch_odds_from_api = AsyncMock(return_value=sample_api_response)
+        odds_service.fetch_odds_from_api = AsyncMock(return_value=SAMPLE_API_RESPONSE)
 
         # Mock the repository create_or_skip
         with patch("src.services.odds_service.OddsRepository") as mock_repo:
-            mock_odds = MagicMock()
-            mock_odds.id = 1
-            mock_repo.create_or_skip.return_value = mock_odds
+            mock_repo.create_or_skip.return_value = SimpleNamespace(id=1)
 
             result = await odds_service.fetch_and_store_current_odds(
                 season, week, is_closing=True
@@ -157,6 +159,23 @@ class TestOddsService:
             assert result[0] == 1
             mock_repo.create_or_skip.assert_called_once()
 
+    @pytest.mark.parametrize("n_games", [1, 3])
+    async def test_fetch_and_store_makes_one_api_call_per_slate(
+        self, odds_service, n_games
+    ):
+        """Test that a whole week's games come from a single API request."""
+        slate = [dict(SAMPLE_API_RESPONSE[0], id=f"game{i}") for i in range(n_games)]
+        odds_service.fetch_odds_from_api = AsyncMock(return_value=slate)
+
+        with patch("src.services.odds_service.OddsRepository") as mock_repo:
+            mock_repo.create_or_skip.return_value = SimpleNamespace(id=1)
+
+            result = await odds_service.fetch_and_store_current_odds(2024, 1)
+
+            odds_service.fetch_odds_from_api.assert_awaited_once()
+            assert mock_repo.create_or_skip.call_count == n_games
+            assert len(result) == n_games
+
     def test_get_closing_line_value(self, odds_service, mock_db_session):
         """Test calculating closing line value."""
         season = 2024
@@ -164,14 +183,15 @@ class TestOddsService:
         team = "KC"
 
         # Mock repository response
-        mock_odds = MagicMock()
-        mock_odds.spread_home = Decimal("-3.0")
-        mock_odds.spread_away = Decimal("3.0")
-        mock_odds.moneyline_home = -150
-        mock_odds.moneyline_away = 130
-        mock_odds.over_under = Decimal("47.5")
-        mock_odds.sportsbook = "DraftKings"
-        mock_odds.timestamp = datetime(2024, 9, 8, 20, 0, tzinfo=timezone.utc)
+        mock_odds = SimpleNamespace(
+            spread_home=Decimal("-3.0"),
+            spread_away=Decimal("3.0"),
+            moneyline_home=-150,
+            moneyline_away=130,
+            over_under=Decimal("47.5"),
+            sportsbook="DraftKings",
+            timestamp=datetime(2024, 9, 8, 20, 0, tzinfo=timezone.utc),
+        )
 
         with patch("src.services.odds_service.OddsRepository") as mock_repo:
             mock_repo.get_by_team.return_value = [mock_odds]
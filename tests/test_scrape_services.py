@@ -0,0 +1,76 @@
+"""
+Threading tests for the PFR scrape services.
+
+Fetching (including the SCRAPE_DELAY_SECONDS sleep) and parsing are
+blocking, so each scrape_and_store must hand them to a worker thread
+instead of running them on the event loop.
+"""
+
+import sys
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.core.scraper_utils import _selenium_fetch_lock
+from src.main import SCRAPE_DISPATCH
+from src.services import scrape_service
+
+
+class TestAsyncThreadPool:
+    """Tests that scrape services keep blocking work off the event loop."""
+
+    @pytest.mark.parametrize(
+        "stat_type", list(SCRAPE_DISPATCH), ids=[t.value for t in SCRAPE_DISPATCH]
+    )
+    async def test_get_dataframe_runs_off_loop_thread(self, monkeypatch, stat_type):
+        """Test that get_dataframe runs in a worker, not the event-loop thread."""
+        scrape_fn = SCRAPE_DISPATCH[stat_type]
+        module = sys.modules[scrape_fn.__module__]
+        threads = []
+
+        def get_dataframe(season):
+            threads.append(threading.get_ident())
+            return []
+
+        monkeypatch.setattr(module, "get_dataframe", get_dataframe)
+        monkeypatch.setattr(module, "SessionLocal", lambda: MagicMock(spec=Session))
+
+        assert await scrape_fn(2023) == []
+        assert len(threads) == 1
+        assert threads[0] != threading.get_ident()
+
+
+class TestTeamGamelogFetch:
+    """Tests that the team-gamelog download shares the Selenium fetch lock."""
+
+    async def test_driver_session_holds_lock_off_loop_thread(self, monkeypatch):
+        """Test that the driver runs in a worker while holding the fetch lock."""
+        seen = []
+
+        def get(url):
+            seen.append((url, _selenium_fetch_lock.locked(), threading.get_ident()))
+
+        driver = MagicMock()
+        driver.get.side_effect = get
+        monkeypatch.setattr(scrape_service.time, "sleep", lambda seconds: None)
+        monkeypatch.setattr(scrape_service.webdriver, "Chrome", lambda **kw: driver)
+        monkeypatch.setattr(scrape_service, "ChromeDriverManager", MagicMock())
+        monkeypatch.setattr(scrape_service, "Service", MagicMock())
+        monkeypatch.setattr(
+            scrape_service, "extract_excel_bytes_from_dlink", lambda d: b"<table/>"
+        )
+        monkeypatch.setattr(
+            scrape_service, "parse_xlsx_to_games", lambda data, team: [data, team]
+        )
+
+        result = await scrape_service.download_team_gamelog("KAN", 2023)
+
+        assert result == [b"<table/>", "KAN"]
+        url, locked, thread = seen[0]
+        assert url == "https://www.pro-football-reference.com/teams/kan/2023.htm"
+        assert locked
+        assert thread != threading.get_ident()
+        driver.quit.assert_called_once()
+        assert not _selenium_fetch_lock.locked()
@@ -5,9 +5,20 @@ Tests retry logic, URL processing, user-agent rotation, and error handling.
 """
 
 import pytest
+import threading
 import time
-from unittest.mock import patch, MagicMock
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import call, patch, MagicMock
+from bs4 import BeautifulSoup
+
 from src.core.scraper_utils import (
+    build_cell_mapper,
+    clean_player_name,
+    clean_value,
+    fetch_page_with_selenium,
+    find_pfr_table,
+    find_pfr_tables,
     strip_url_hash,
     get_random_user_agent,
     get_random_proxy,
@@ -81,26 +92,207 @@ class TestUserAgentRotation:
 class TestProxyRotation:
     """Tests for proxy rotation."""
 
-    def test_get_random_proxy_when_disabled(self):
+    def test_get_random_proxy_when_disabled(self, settings_override):
         """Test that get_random_proxy returns None when proxy rotation is disabled."""
-        with patch.object(settings, "SCRAPE_USE_PROXY", False):
-            assert get_random_proxy() is None
+        settings_override(SCRAPE_USE_PROXY=False)
+        assert get_random_proxy() is None
 
-    def test_get_random_proxy_when_enabled_but_empty_list(self):
+    def test_get_random_proxy_when_enabled_but_empty_list(self, settings_override):
         """Test that get_random_proxy returns None when proxy list is empty."""
-        with patch.object(settings, "SCRAPE_USE_PROXY", True):
-            with patch.object(settings, "SCRAPE_PROXY_LIST", []):
-                assert get_random_proxy() is None
+        settings_override(SCRAPE_USE_PROXY=True, SCRAPE_PROXY_LIST=[])
+        assert get_random_proxy() is None
 
-    def test_get_random_proxy_when_enabled_with_proxies(self):
+    def test_get_random_proxy_when_enabled_with_proxies(self, settings_override):
         """Test that get_random_proxy returns a proxy when enabled."""
         test_proxies = ["http://proxy1:8080", "http://proxy2:8080"]
-        with patch.object(settings, "SCRAPE_USE_PROXY", True):
-            with patch.object(settings, "SCRAPE_PROXY_LIST", test_proxies):
-                proxy = get_random_proxy()
-                assert proxy in test_proxies
+        settings_override(SCRAPE_USE_PROXY=True, SCRAPE_PROXY_LIST=test_proxies)
+        proxy = get_random_proxy()
+        assert proxy in test_proxies
+
+
+# A PFR-style page: one visible table and one hidden in an HTML comment.
+_PFR_PAGE_HTML = """
+<html><body>
+<table id="AFC"><tr><td data-stat="team">Kansas City Chiefs</td></tr></table>
+<!--
+<table id="NFC"><tr><td data-stat="team">Detroit Lions</td></tr></table>
+-->
+</body></html>
+"""
+
+
+class TestFindPfrTables:
+    """Tests for locating PFR tables in visible DOM and HTML comments."""
+
+    def test_finds_visible_and_commented_tables_in_one_call(self):
+        """Test that both visible and comment-hidden tables are returned."""
+        tables = find_pfr_tables(_PFR_PAGE_HTML, ["AFC", "NFC"])
+
+        assert "Kansas City Chiefs" in tables["AFC"].text
+        assert "Detroit Lions" in tables["NFC"].text
+
+    def test_missing_table_maps_to_none(self):
+        """Test that an unknown table ID maps to None."""
+        tables = find_pfr_tables(_PFR_PAGE_HTML, ["AFC", "passing"])
+
+        assert tables["AFC"] is not None
+        assert tables["passing"] is None
+
+    def test_find_pfr_table_delegates(self):
+        """Test that the single-table helper matches the batch result."""
+        assert "Detroit Lions" in find_pfr_table(_PFR_PAGE_HTML, "NFC").text
+        assert find_pfr_table(_PFR_PAGE_HTML, "passing") is None
+
+
+def _make_driver(html, title="Pro Football Reference"):
+    """Build a fake Chrome driver serving html under the given title."""
+    driver = MagicMock()
+    driver.page_source = html
+    driver.title = title
+    return driver
+
+
+@pytest.fixture
+def mock_sleep():
+    """Skip rate-limit, Cloudflare and retry waits; yield the time.sleep mock."""
+    with patch("src.core.scraper_utils.time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+@pytest.mark.usefixtures("mock_sleep")
+class TestFetchPageWithSelenium:
+    """Tests for the Selenium fetcher with Chrome and all waits stubbed out."""
+
+    @pytest.fixture
+    def mock_chrome(self):
+        """Patch driver construction; yield the webdriver.Chrome mock."""
+        with patch("src.core.scraper_utils.webdriver.Chrome") as chrome, patch(
+            "src.core.scraper_utils.ChromeDriverManager"
+        ), patch("src.core.scraper_utils.Service"):
+            yield chrome
+
+    def test_returns_page_source_and_quits(self, mock_chrome):
+        """Test that the page source is returned and the driver always quits."""
+        driver = _make_driver(_PFR_PAGE_HTML)
+        mock_chrome.return_value = driver
+
+        html = fetch_page_with_selenium("https://example.com/page#anchor")
+
+        assert html == _PFR_PAGE_HTML
+        driver.get.assert_called_once_with("https://example.com/page")
+        driver.quit.assert_called_once()
+
+    def test_waits_longer_on_cloudflare_challenge(self, mock_chrome, mock_sleep):
+        """Test that a Cloudflare interstitial title triggers the extra wait."""
+        mock_chrome.return_value = _make_driver(
+            _PFR_PAGE_HTML, title="Just a moment..."
+        )
+
+        fetch_page_with_selenium("https://example.com/page")
+
+        assert call(15) in mock_sleep.call_args_list
+
+    def test_concurrent_fetches_are_serialized(self, mock_chrome):
+        """Test that fetches from several threads never overlap."""
+        in_flight = []
+        overlaps = []
+
+        def get(url):
+            overlaps.append(len(in_flight))
+            in_flight.append(url)
+            # time.sleep is patched out; give other threads a window to enter.
+            threading.Event().wait(0.02)
+            in_flight.remove(url)
+
+        driver = _make_driver(_PFR_PAGE_HTML)
+        driver.get.side_effect = get
+        mock_chrome.return_value = driver
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            pages = list(
+                pool.map(
+                    fetch_page_with_selenium,
+                    [f"https://example.com/{n}" for n in range(4)],
+                )
+            )
+
+        assert pages == [_PFR_PAGE_HTML] * 4
+        assert overlaps == [0, 0, 0, 0]
+
+
+class TestCleanValue:
+    """Tests for scraped value cleaning."""
+
+    def test_str_passes_through(self):
+        """Test that cell text, including empty text, is returned unchanged."""
+        assert clean_value("KAN") == "KAN"
+        assert clean_value("") == ""
+
+    def test_nan_becomes_none(self):
+        """Test that NaN/None map to None."""
+        assert clean_value(float("nan")) is None
+        assert clean_value(None) is None
+
+    def test_numpy_scalar_unwrapped(self):
+        """Test that numpy scalars become plain Python values."""
+        result = clean_value(np.int64(7))
+        assert result == 7
+        assert type(result) is int
+
+
+class TestCleanPlayerName:
+    """Tests for PFR player-name cleanup."""
+
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("Patrick Mahomes*", "Patrick Mahomes"),
+            ("Justin Jefferson*+", "Justin Jefferson"),
+            ("Odell Beckham Jr.", "Odell Beckham Jr."),
+        ],
+    )
+    def test_strips_award_markers(self, raw, expected):
+        """Test that only trailing Pro Bowl/All-Pro markers are removed."""
+        assert clean_player_name(raw) == expected
+
+
+# Row markup for the cell-mapper tests; parsed once by the parsed_rows fixture.
+_FULL_ROW_HTML = (
+    '<tr><td data-stat="team"> KAN </td><td data-stat="points">450</td>'
+    '<td data-stat="unused">x</td><td>no stat</td></tr>'
+)
+_PARTIAL_ROW_HTML = '<tr><td data-stat="team">KAN</td></tr>'
+
+
+@pytest.fixture(scope="module")
+def parsed_rows():
+    """Cells of each sample row, parsed with lxml once per module.
+
+    The mapper only reads the tags, so tests can share them.
+    """
+    return {
+        name: BeautifulSoup(html, "lxml").find("tr").find_all("td")
+        for name, html in (("full", _FULL_ROW_HTML), ("partial", _PARTIAL_ROW_HTML))
+    }
+
+
+class TestBuildCellMapper:
+    """Tests for the per-service cell mapper."""
+
+    def test_maps_known_columns_and_skips_others(self, parsed_rows):
+        """Test that only COLUMN_MAP data-stats are mapped, with text stripped."""
+        map_cells = build_cell_mapper({"team": "tm", "points": "pf"})
+
+        assert map_cells(parsed_rows["full"]) == {"tm": "KAN", "pf": "450"}
+
+    def test_missing_cells_default_to_none(self, parsed_rows):
+        """Test that every mapped field is present even when its cell is absent."""
+        map_cells = build_cell_mapper({"team": "tm", "points": "pf"})
+
+        assert map_cells(parsed_rows["partial"]) == {"tm": "KAN", "pf": None}
 
 
+@pytest.mark.usefixtures("mock_sleep")
 class TestRetryWithBackoff:
     """Tests for retry logic with exponential backoff."""
 
@@ -117,49 +309,42 @@ class TestRetryWithBackoff:
         """Test that function retries after a single failure."""
         mock_func = MagicMock(side_effect=[Exception("First fail"), "success"])
 
-        with patch("time.sleep"):  # Mock sleep to speed up test
-            result = retry_with_backoff(
-                mock_func, max_retries=2, retry_delays=[1], url="http://test.com"
-            )
+        result = retry_with_backoff(
+            mock_func, max_retries=2, retry_delays=[1], url="http://test.com"
+        )
 
         assert result == "success"
         assert mock_func.call_count == 2
 
-    def test_retry_with_exponential_backoff(self):
+    def test_retry_with_exponential_backoff(self, mock_sleep):
         """Test that retry uses exponential backoff delays."""
         mock_func = MagicMock(
             side_effect=[Exception("Fail 1"), Exception("Fail 2"), "success"]
         )
 
-        sleep_times = []
-
-        def capture_sleep(seconds):
-            sleep_times.append(seconds)
-
-        with patch("time.sleep", side_effect=capture_sleep):
-            result = retry_with_backoff(
-                mock_func,
-                max_retries=3,
-                retry_delays=[30, 60, 120],
-                url="http://test.com",
-            )
+        result = retry_with_backoff(
+            mock_func,
+            max_retries=3,
+            retry_delays=[30, 60, 120],
+            url="http://test.com",
+        )
 
         assert result == "success"
         assert mock_func.call_count == 3
-        assert sleep_times == [30, 60]  # Two sleeps between 3 attempts
+        # Two sleeps between 3 attempts
+        assert mock_sleep.call_args_list == [call(30), call(60)]
 
     def test_all_retries_exhausted(self):
         """Test that exception is raised when all retries are exhausted."""
         mock_func = MagicMock(side_effect=Exception("Always fails"))
 
-        with patch("time.sleep"):
-            with pytest.raises(Exception, match="Always fails"):
-                retry_with_backoff(
-                    mock_func,
-                    max_retries=3,
-                    retry_delays=[1, 2, 4],
-                    url="http://test.com",
-                )
+        with pytest.raises(Exception, match="Always fails"):
+            retry_with_backoff(
+                mock_func,
+                max_retries=3,
+                retry_delays=[1, 2, 4],
+                url="http://test.com",
+            )
 
         assert mock_func.call_count == 3
 
@@ -167,8 +352,7 @@ class TestRetryWithBackoff:
         """Test that function uses default settings from config."""
         mock_func = MagicMock(side_effect=[Exception("Fail"), "success"])
 
-        with patch("time.sleep"):
-            result = retry_with_backoff(mock_func, url="http://test.com")
+        result = retry_with_backoff(mock_func, url="http://test.com")
 
         assert result == "success"
         # Should use settings.SCRAPE_MAX_RETRIES (default 3)
@@ -178,11 +362,10 @@ class TestRetryWithBackoff:
         """Test that custom max_retries parameter is respected."""
         mock_func = MagicMock(side_effect=Exception("Always fails"))
 
-        with patch("time.sleep"):
-            with pytest.raises(Exception):
-                retry_with_backoff(
-                    mock_func, max_retries=5, retry_delays=[1], url="http://test.com"
-                )
+        with pytest.raises(Exception):
+            retry_with_backoff(
+                mock_func, max_retries=5, retry_delays=[1], url="http://test.com"
+            )
 
         assert mock_func.call_count == 5
 
@@ -194,10 +377,9 @@ class TestRetryWithBackoff:
 
         mock_func = MagicMock(side_effect=[Exception("Fail"), "success"])
 
-        with patch("time.sleep"):
-            retry_with_backoff(
-                mock_func, max_retries=2, retry_delays=[1], url="http://test.com"
-            )
+        retry_with_backoff(
+            mock_func, max_retries=2, retry_delays=[1], url="http://test.com"
+        )
 
         # Check that appropriate log messages were created
         log_messages = [record.message for record in caplog.records]
@@ -230,13 +412,12 @@ class TestRetryWithBackoff:
 
         mock_func = MagicMock(side_effect=[Http403Error("403 Forbidden"), "success"])
 
-        with patch("time.sleep"):
-            result = retry_with_backoff(
-                mock_func,
-                max_retries=2,
-                retry_delays=[30],
-                url="http://test.com#all_team_stats",
-            )
+        result = retry_with_backoff(
+            mock_func,
+            max_retries=2,
+            retry_delays=[30],
+            url="http://test.com#all_team_stats",
+        )
 
         assert result == "success"
         assert mock_func.call_count == 2
@@ -0,0 +1,103 @@
+"""
+Unit tests for the Scrapling fetch backend.
+
+scrapling is an optional dependency, so the tests swap fake fetcher
+classes onto the already-imported scrapling_fetcher module with monkeypatch.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core import scrapling_fetcher as sf
+from src.core.scraper_utils import fetch_page
+
+
+@pytest.fixture
+def mock_fetchers(monkeypatch):
+    """Swap fake Scrapling fetcher classes onto the loaded module for one test."""
+    fetchers = SimpleNamespace(Fetcher=MagicMock(), StealthyFetcher=MagicMock())
+    monkeypatch.setattr(sf, "Fetcher", fetchers.Fetcher)
+    monkeypatch.setattr(sf, "StealthyFetcher", fetchers.StealthyFetcher)
+    return fetchers
+
+
+# Scrapling backend with no rate-limit delay or proxy; tests override
+# individual keys on top of it through settings_override.
+SCRAPLING_SETTINGS = {
+    "SCRAPE_BACKEND": "scrapling",
+    "SCRAPE_DELAY_SECONDS": 0,
+    "SCRAPE_USE_PROXY": False,
+    "SCRAPE_PROXY_LIST": [],
+    "SCRAPLING_FETCHER_TYPE": "fetcher",
+    "SCRAPLING_TIMEOUT": 30,
+    "SCRAPLING_IMPERSONATE": "chrome",
+}
+
+
+class TestScraplingBackend:
+    """Tests for fetch_page dispatch to, and behaviour of, the Scrapling fetcher."""
+
+    @pytest.mark.parametrize(
+        "ftype, attr, call_method, html",
+        [
+            ("stealthy", "StealthyFetcher", "fetch", "<html><body>test</body></html>"),
+            ("fetcher", "Fetcher", "get", "<html>fetcher</html>"),
+        ],
+    )
+    def test_fetch_page_dispatches_on_fetcher_type(
+        self,
+        mock_fetchers,
+        settings_override,
+        ftype,
+        attr,
+        call_method,
+        html,
+    ):
+        """Test that SCRAPLING_FETCHER_TYPE picks the one Scrapling fetcher used."""
+        settings_override(**{**SCRAPLING_SETTINGS, "SCRAPLING_FETCHER_TYPE": ftype})
+        method = getattr(getattr(mock_fetchers, attr), call_method)
+        method.return_value = SimpleNamespace(html_content=html, status=200)
+
+        assert fetch_page("https://example.com/page") == html
+        method.assert_called_once()
+        total_calls = (
+            mock_fetchers.Fetcher.get.call_count
+            + mock_fetchers.StealthyFetcher.fetch.call_count
+        )
+        assert total_calls == 1
+
+    def test_strips_hash_and_passes_impersonate(self, mock_fetchers, settings_override):
+        """Test that the URL fragment is dropped and impersonation is forwarded."""
+        settings_override(**{**SCRAPLING_SETTINGS, "SCRAPLING_IMPERSONATE": "Firefox"})
+        mock_fetchers.Fetcher.get.return_value = SimpleNamespace(
+            html_content="<html></html>", status=200
+        )
+
+        sf.fetch_page_with_scrapling("https://example.com/page#passing")
+
+        args, kwargs = mock_fetchers.Fetcher.get.call_args
+        assert args == ("https://example.com/page",)
+        assert kwargs["impersonate"] == "firefox"
+
+    def test_empty_response_raises(self, mock_fetchers, settings_override):
+        """Test that an empty page is reported instead of returned."""
+        settings_override(**SCRAPLING_SETTINGS)
+        mock_fetchers.Fetcher.get.return_value = SimpleNamespace(
+            html_content="", status=403
+        )
+
+        with pytest.raises(RuntimeError, match="empty response"):
+            sf.fetch_page_with_scrapling("https://example.com/page")
+
+    def test_missing_scrapling_raises_import_error(
+        self, monkeypatch, settings_override
+    ):
+        """Test that selecting the backend without scrapling installed fails clearly."""
+        settings_override(**SCRAPLING_SETTINGS)
+        monkeypatch.setattr(sf, "Fetcher", None)
+        monkeypatch.setattr(sf, "StealthyFetcher", None)
+
+        with pytest.raises(ImportError, match="scrapling is not installed"):
+            fetch_page("https://example.com/page")
@@ -0,0 +1,90 @@
+"""
+Unit tests for scraping player/team stat pairs from one PFR page.
+
+The page fetch is patched out; parsing runs for real against a small
+PFR-style punting table.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.services import (
+    punting_stats_service,
+    punting_team_service,
+    shared_page_service,
+)
+from src.services.shared_page_service import get_dataframes, scrape_and_store
+
+SAMPLE_PFR_HTML = """
+<html><body>
+<table id="punting">
+<thead><tr><th data-stat="ranker">Rk</th><th data-stat="player">Player</th></tr></thead>
+<tbody>
+<tr>
+<th data-stat="ranker">1</th>
+<td data-stat="player">Johnny Hekker*</td>
+<td data-stat="team">CAR</td>
+<td data-stat="g">17</td>
+<td data-stat="punt">75</td>
+<td data-stat="punt_yds">3500</td>
+</tr>
+</tbody>
+</table>
+</body></html>
+"""
+
+
+@pytest.fixture(scope="module")
+def parsed_page(serve_pfr_page):
+    """SAMPLE_PFR_HTML run through get_dataframes once per module.
+
+    Returns the (player rows, team rows) pair and the URLs fetched.
+    """
+    with serve_pfr_page(shared_page_service, SAMPLE_PFR_HTML) as urls:
+        return get_dataframes(2023, "punting"), urls
+
+
+class TestGetDataframes:
+    """Tests for parsing both services' rows from one fetched page."""
+
+    def test_fetches_page_once(self, parsed_page):
+        """Test that the shared page is requested a single time."""
+        _, urls = parsed_page
+        assert urls == ["https://www.pro-football-reference.com/years/2023/punting.htm"]
+
+    def test_parses_player_and_team_rows(self, parsed_page):
+        """Test that each service's parse_table runs on the shared table."""
+        (player_rows, team_rows), _ = parsed_page
+
+        assert [row["player_name"] for row in player_rows] == ["Johnny Hekker"]
+        assert [(row["tm"], row["pnt"]) for row in team_rows] == [("CAR", "75")]
+
+    def test_raises_on_missing_table(self, serve_pfr_page):
+        """Test that a page without the pair's table is an error."""
+        with serve_pfr_page(shared_page_service, "<html><body></body></html>"):
+            with pytest.raises(Exception, match="Could not find punting"):
+                get_dataframes(2023, "punting")
+
+
+class TestScrapeAndStore:
+    """Tests for handing the parsed rows to each service's store step."""
+
+    async def test_passes_rows_to_both_services(self, monkeypatch):
+        """Test that each service stores its rows without fetching again."""
+        player_rows, team_rows = [{"player_name": "A"}], [{"tm": "CAR"}]
+        monkeypatch.setattr(
+            shared_page_service,
+            "get_dataframes",
+            lambda season, page: (player_rows, team_rows),
+        )
+        store_players = AsyncMock(return_value=["p"])
+        store_teams = AsyncMock(return_value=["t"])
+        monkeypatch.setattr(punting_stats_service, "scrape_and_store", store_players)
+        monkeypatch.setattr(punting_team_service, "scrape_and_store", store_teams)
+
+        result = await scrape_and_store(2023, "punting")
+
+        assert result == {"players": ["p"], "teams": ["t"]}
+        store_players.assert_awaited_once_with(2023, player_rows)
+        store_teams.assert_awaited_once_with(2023, team_rows)
@@ -1,37 +1,63 @@
 """Unit tests for StatsRetrievalService."""
 
 import pytest
-from unittest.mock import Mock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import create_autospec
 from decimal import Decimal
 
+from sqlalchemy.orm import Session
+
 from src.services.stats_retrieval_service import StatsRetrievalService
+from src.repositories.team_offense_repo import TeamOffenseRepository
+from src.repositories.passing_stats_repo import PassingStatsRepository
+from src.repositories.rushing_stats_repo import RushingStatsRepository
+from src.repositories.receiving_stats_repo import ReceivingStatsRepository
+from src.repositories.standings_repo import StandingsRepository
+from src.repositories.team_game_repo import TeamGameRepository
 from src.entities.team_offense import TeamOffense
 from src.entities.passing_stats import PassingStats
 from src.entities.standings import Standings
 
+# Service attribute -> (repository class, whether the service holds an instance).
+# team_game_repo is the class itself; its methods are all static.
+REPO_CLASSES = {
+    "team_offense_repo": (TeamOffenseRepository, True),
+    "passing_stats_repo": (PassingStatsRepository, True),
+    "rushing_stats_repo": (RushingStatsRepository, True),
+    "receiving_stats_repo": (ReceivingStatsRepository, True),
+    "standings_repo": (StandingsRepository, True),
+    "team_game_repo": (TeamGameRepository, False),
+}
 
-class TestStatsRetrievalService:
-    """Test suite for StatsRetrievalService with mocked repositories."""
 
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock database session."""
-        return Mock()
+@pytest.fixture(scope="class")
+def mock_session():
+    """Create an autospecced database session, shared by the test class."""
+    return create_autospec(Session, instance=True)
+
 
-    @pytest.fixture
-    def service(self, mock_session):
-        """Create a StatsRetrievalService with mocked repositories."""
-        service = StatsRetrievalService(mock_session)
+@pytest.fixture(scope="class")
+def service(mock_session):
+    """Create a StatsRetrievalService with autospecced repositories.
 
-        # Mock all repositories
-        service.team_offense_repo = Mock()
-        service.passing_stats_repo = Mock()
-        service.rushing_stats_repo = Mock()
-        service.receiving_stats_repo = Mock()
-        service.standings_repo = Mock()
-        service.team_game_repo = Mock()
+    The autospecs are built once per class; they only expose methods the
+    real repositories have and check call signatures against them.
+    """
+    service = StatsRetrievalService(mock_session)
+    for attr, (repo_cls, instance) in REPO_CLASSES.items():
+        setattr(service, attr, create_autospec(repo_cls, instance=instance))
+    return service
+
+
+class TestStatsRetrievalService:
+    """Test suite for StatsRetrievalService with mocked repositories."""
 
-        return service
+    @pytest.fixture(autouse=True)
+    def _reset_mocks(self, service, mock_session):
+        """Clear calls and stubbed return values left by the previous test."""
+        mock_session.reset_mock()
+        for attr in REPO_CLASSES:
+            getattr(service, attr).reset_mock(return_value=True, side_effect=True)
 
     # Tests for get_all_teams
     def test_get_all_teams_returns_data_with_pagination(self, service):
@@ -229,7 +255,7 @@ class TestStatsRetrievalService:
     def test_get_games_returns_all_games_for_season(self, service):
         """Test that get_games returns all games when week is not specified."""
         # Arrange
-        mock_games = [Mock(), Mock(), Mock()]
+        mock_games = [SimpleNamespace(), SimpleNamespace(), SimpleNamespace()]
         service.team_game_repo.find_by_season_and_week.return_value = mock_games
         service.team_game_repo.count_by_season.return_value = 256
 
@@ -244,7 +270,7 @@ class TestStatsRetrievalService:
     def test_get_games_filters_by_week(self, service):
         """Test that get_games filters by week when specified."""
         # Arrange
-        mock_games = [Mock(), Mock()]
+        mock_games = [SimpleNamespace(), SimpleNamespace()]
         service.team_game_repo.find_by_season_and_week.return_value = mock_games
         service.team_game_repo.count_by_season.return_value = 16
 
@@ -274,9 +300,9 @@ class TestStatsRetrievalService:
     def test_search_players_searches_all_categories(self, service):
         """Test that search_players queries all stat categories."""
         # Arrange
-        mock_passing = [Mock()]
-        mock_rushing = [Mock()]
-        mock_receiving = [Mock()]
+        mock_passing = [SimpleNamespace()]
+        mock_rushing = [SimpleNamespace()]
+        mock_receiving = [SimpleNamespace()]
 
         service.passing_stats_repo.search_players.return_value = mock_passing
         service.rushing_stats_repo.search_players.return_value = mock_rushing
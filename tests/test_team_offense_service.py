@@ -0,0 +1,194 @@
+"""
+Unit tests for the team offense scrape service.
+
+The page fetch, DB session and repository are patched out; parsing runs
+for real against a small PFR-style team_stats table.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.services import team_offense_service
+from src.services.team_offense_service import (
+    COLUMN_MAP,
+    get_dataframe,
+    scrape_and_store_team_offense,
+)
+
+# PFR data-stat names for the team_stats columns, and two team rows in
+# that order. The sample page is generated from them.
+COLUMNS = (
+    "team",
+    "g",
+    "points",
+    "total_yards",
+    "plays_offense",
+    "yds_per_play_offense",
+    "turnovers",
+    "fumbles_lost",
+    "first_down",
+    "pass_cmp",
+    "pass_att",
+    "pass_yds",
+    "pass_td",
+    "pass_int",
+    "pass_net_yds_per_att",
+    "pass_fd",
+    "rush_att",
+    "rush_yds",
+    "rush_td",
+    "rush_yds_per_att",
+    "rush_fd",
+    "penalties",
+    "penalties_yds",
+    "pen_fd",
+    "score_pct",
+    "turnover_pct",
+    "exp_pts_tot",
+)
+# fmt: off
+ROW_KAN = (
+    "Kansas City Chiefs", 17, 371, 5803, 1084, 5.4, 28, 11, 332,
+    401, 620, 4183, 27, 17, 6.4, 213,
+    435, 1620, 9, 3.7, 94,
+    102, 842, 25, 39.4, 13.6, 57.35,
+)
+ROW_SFO = (
+    "San Francisco 49ers", 17, 491, 6773, 1059, 6.4, 18, 8, 358,
+    319, 473, 4384, 33, 11, 8.6, 212,
+    485, 2389, 19, 4.9, 117,
+    95, 866, 29, 50.0, 9.5, 158.91,
+)
+# fmt: on
+
+
+def _pfr_row(values):
+    """Render one team_stats <tr> with a data-stat cell per column."""
+    cells = "".join(f'<td data-stat="{c}">{v}</td>' for c, v in zip(COLUMNS, values))
+    return f"<tr>{cells}</tr>"
+
+
+SAMPLE_PFR_HTML = f"""
+<html><body>
+<table id="team_stats">
+<thead><tr><th data-stat="team">Tm</th><th data-stat="points">PF</th></tr></thead>
+<tbody>
+{_pfr_row(ROW_KAN)}
+<tr class="thead"><td data-stat="team">Tm</td></tr>
+{_pfr_row(ROW_SFO)}
+<tr><td data-stat="team"></td><td data-stat="points">0</td></tr>
+</tbody>
+</table>
+</body></html>
+"""
+
+
+@pytest.fixture(scope="module")
+def parsed_page(serve_pfr_page):
+    """SAMPLE_PFR_HTML parsed by get_dataframe once per module.
+
+    Tests only read the result, so they share one parse. Returns the rows
+    and the URLs the fake fetch was asked for.
+    """
+    with serve_pfr_page(team_offense_service, SAMPLE_PFR_HTML) as urls:
+        return get_dataframe(2023), urls
+
+
+@pytest.fixture(scope="module")
+def sample_rows(parsed_page):
+    """Rows parsed from SAMPLE_PFR_HTML."""
+    return parsed_page[0]
+
+
+class TestGetDataframe:
+    """Tests for parsing the PFR team_stats table into row dicts."""
+
+    def test_returns_one_row_per_team(self, sample_rows):
+        """Test that header and blank-team rows are skipped."""
+        assert [row["tm"] for row in sample_rows] == [
+            "Kansas City Chiefs",
+            "San Francisco 49ers",
+        ]
+
+    def test_maps_columns_and_season(self, sample_rows):
+        """Test that every data-stat cell maps onto its COLUMN_MAP field."""
+        expected = {COLUMN_MAP[c]: str(v) for c, v in zip(COLUMNS, ROW_KAN)}
+
+        assert sample_rows[0] == {**expected, "season": 2023}
+
+    def test_fetches_season_url(self, parsed_page):
+        """Test that the season's PFR page is requested exactly once."""
+        _, urls = parsed_page
+        assert urls == ["https://www.pro-football-reference.com/years/2023/"]
+
+    def test_raises_on_missing_table(self, serve_pfr_page):
+        """Test that a page without team_stats is an error."""
+        with serve_pfr_page(team_offense_service, "<html><body></body></html>"):
+            with pytest.raises(Exception, match="Could not find team_stats"):
+                get_dataframe(2023)
+
+
+@pytest.fixture
+def mock_session():
+    """DB session stub for SessionLocal to return.
+
+    spec=Session limits it to real Session attributes, so a typo'd call
+    fails instead of silently growing a new child mock.
+    """
+    return MagicMock(spec=Session)
+
+
+@pytest.fixture
+def mock_repo_cls(monkeypatch, mock_session):
+    """Point the service at mock_session and a mock repository class."""
+    repo_cls = MagicMock()
+    monkeypatch.setattr(team_offense_service, "SessionLocal", lambda: mock_session)
+    monkeypatch.setattr(team_offense_service, "TeamOffenseRepository", repo_cls)
+    return repo_cls
+
+
+class TestScrapeAndStoreTeamOffense:
+    """Tests for storing parsed rows through the repository."""
+
+    async def test_calls_repo_create_for_each_record(
+        self, monkeypatch, mock_repo_cls, mock_session, sample_rows
+    ):
+        """Test that every parsed row is validated and saved in one commit."""
+        monkeypatch.setattr(
+            team_offense_service, "get_dataframe", lambda season: sample_rows
+        )
+
+        result = await scrape_and_store_team_offense(2023)
+
+        assert len(result) == 2
+        assert mock_repo_cls.return_value.create.call_count == 2
+        mock_session.commit.assert_called_once()
+
+    async def test_session_closed_on_success(
+        self, monkeypatch, mock_repo_cls, mock_session
+    ):
+        """Test that the session is closed after a successful scrape."""
+        monkeypatch.setattr(team_offense_service, "get_dataframe", lambda season: [])
+
+        result = await scrape_and_store_team_offense(2023)
+
+        assert result == []
+        mock_session.close.assert_called_once()
+
+    async def test_session_closed_on_failure(
+        self, monkeypatch, mock_repo_cls, mock_session
+    ):
+        """Test that the session is closed even when the scrape fails."""
+
+        def missing_table(season):
+            raise Exception("Could not find team_stats table")
+
+        monkeypatch.setattr(team_offense_service, "get_dataframe", missing_table)
+
+        with pytest.raises(Exception, match="team_stats"):
+            await scrape_and_store_team_offense(2023)
+
+        mock_session.commit.assert_not_called()
+        mock_session.close.assert_called_once()
@@ -3,7 +3,6 @@ Unit tests for DTO validation.
 """
 
 import pytest
-from decimal import Decimal
 from datetime import date
 from pydantic import ValidationError
 
@@ -30,37 +29,34 @@ class TestTeamOffenseDTO:
     def test_valid_create(self):
         """Test creating a valid TeamOffenseCreate DTO."""
         dto = TeamOffenseCreate(
-            season=2023, tm="KAN", g=17, pf=450, yds=6000, sc_pct=Decimal("45.5")
+            season=2023, tm="KAN", g=17, pf=450, yds=6000, sc_pct=45.5
         )
         assert dto.season == 2023
         assert dto.tm == "KAN"
         assert dto.g == 17
 
-    def test_season_range_validation(self):
-        """Test season must be between 1920-2100."""
-        with pytest.raises(ValidationError):
-            TeamOffenseCreate(season=1900, tm="KAN")
-
-        with pytest.raises(ValidationError):
-            TeamOffenseCreate(season=2150, tm="KAN")
-
-    def test_negative_stats_rejected(self):
-        """Test that negative stats are rejected."""
-        with pytest.raises(ValidationError):
-            TeamOffenseCreate(season=2023, tm="KAN", pf=-10)
-
-        with pytest.raises(ValidationError):
-            TeamOffenseCreate(season=2023, tm="KAN", yds=-100)
-
-    def test_empty_team_name_rejected(self):
-        """Test that empty team name is rejected."""
-        with pytest.raises(ValidationError):
-            TeamOffenseCreate(season=2023, tm="")
-
-    def test_percentage_range(self):
-        """Test percentage fields are in valid range."""
-        with pytest.raises(ValidationError):
-            TeamOffenseCreate(season=2023, tm="KAN", sc_pct=Decimal("150.0"))
+    def test_scraped_string_becomes_float(self):
+        """Test that scraped cell text validates into a float field."""
+        dto = TeamOffenseCreate(season=2023, tm="KAN", opea="57.35", ypp="5.4")
+        assert dto.opea == 57.35
+        assert type(dto.opea) is float
+        assert dto.ypp == 5.4
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"season": 1900},  # season must be between 1920-2100
+            {"season": 2150},
+            {"pf": -10},  # negative stats rejected
+            {"yds": -100},
+            {"tm": ""},  # empty team name rejected
+            {"sc_pct": 150.0},  # percentage out of range
+        ],
+    )
+    def test_invalid_fields_rejected(self, overrides):
+        """Test that each out-of-range field fails validation."""
+        with pytest.raises(ValidationError):
+            TeamOffenseCreate(**{"season": 2023, "tm": "KAN", **overrides})
 
 
 class TestTeamDefenseDTO:
@@ -107,7 +103,7 @@ class TestPassingStatsDTO:
                 season=2023,
                 player_name="Test Player",
                 tm="KAN",
-                cmp_pct=Decimal("150.0"),
+                cmp_pct=150.0,
             )
 
 
@@ -162,18 +158,18 @@ class TestDefenseStatsDTO:
             season=2023,
             player_name="T.J. Watt",
             tm="PIT",
-            sk=Decimal("19.0"),
+            sk=19.0,
             comb=64,
             solo=48,
         )
         assert dto.player_name == "T.J. Watt"
-        assert dto.sk == Decimal("19.0")
+        assert dto.sk == 19.0
 
     def test_negative_sacks_rejected(self):
         """Test that negative sacks are rejected."""
         with pytest.raises(ValidationError):
             DefenseStatsCreate(
-                season=2023, player_name="Test Player", tm="PIT", sk=Decimal("-5.0")
+                season=2023, player_name="Test Player", tm="PIT", sk=-5.0
             )
 
 
@@ -188,7 +184,7 @@ class TestKickingStatsDTO:
             tm="BAL",
             fga=35,
             fgm=32,
-            fg_pct=Decimal("91.4"),
+            fg_pct=91.4,
         )
         assert dto.player_name == "Justin Tucker"
         assert dto.fgm == 32
@@ -200,7 +196,7 @@ class TestKickingStatsDTO:
                 season=2023,
                 player_name="Test Kicker",
                 tm="BAL",
-                fg_pct=Decimal("150.0"),
+                fg_pct=150.0,
             )
 
 
@@ -215,7 +211,7 @@ class TestPuntingStatsDTO:
             tm="CAR",
             pnt=75,
             yds=3500,
-            ypp=Decimal("46.7"),
+            ypp=46.7,
         )
         assert dto.player_name == "Johnny Hekker"
         assert dto.pnt == 75
@@ -275,22 +271,24 @@ class TestStandingsDTO:
             w=14,
             l=3,
             t=0,
-            win_pct=Decimal("0.824"),
+            win_pct=0.824,
             pf=450,
             pa=320,
         )
         assert dto.tm == "KAN"
         assert dto.w == 14
 
-    def test_win_percentage_range(self):
-        """Test win percentage must be between 0-1."""
-        with pytest.raises(ValidationError):
-            StandingsCreate(season=2023, tm="KAN", win_pct=Decimal("1.5"))
-
-    def test_negative_wins_rejected(self):
-        """Test that negative wins are rejected."""
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"win_pct": 1.5},  # win percentage must be between 0-1
+            {"w": -1},  # negative wins rejected
+        ],
+    )
+    def test_invalid_fields_rejected(self, overrides):
+        """Test that each out-of-range field fails validation."""
         with pytest.raises(ValidationError):
-            StandingsCreate(season=2023, tm="KAN", w=-1)
+            StandingsCreate(**{"season": 2023, "tm": "KAN", **overrides})
 
 
 class TestGamesDTO:
@@ -328,9 +326,7 @@ class TestKickingDTO:
 
     def test_valid_create(self):
         """Test creating a valid KickingCreate DTO."""
-        dto = KickingCreate(
-            season=2023, tm="BAL", g=17, fga=35, fgm=32, fg_pct=Decimal("91.4")
-        )
+        dto = KickingCreate(season=2023, tm="BAL", g=17, fga=35, fgm=32, fg_pct=91.4)
         assert dto.season == 2023
         assert dto.tm == "BAL"
         assert dto.fgm == 32
@@ -351,7 +347,7 @@ class TestKickingDTO:
     def test_percentage_validation(self):
         """Test FG percentage in valid range."""
         with pytest.raises(ValidationError):
-            KickingCreate(season=2023, tm="BAL", fg_pct=Decimal("150.0"))
+            KickingCreate(season=2023, tm="BAL", fg_pct=150.0)
 
     def test_empty_team_name_rejected(self):
         """Test that empty team name is rejected."""
@@ -364,9 +360,7 @@ class TestPuntingDTO:
 
     def test_valid_create(self):
         """Test creating a valid PuntingCreate DTO."""
-        dto = PuntingCreate(
-            season=2023, tm="CAR", g=17, pnt=75, yds=3500, ypp=Decimal("46.7")
-        )
+        dto = PuntingCreate(season=2023, tm="CAR", g=17, pnt=75, yds=3500, ypp=46.7)
         assert dto.season == 2023
         assert dto.tm == "CAR"
         assert dto.pnt == 75
@@ -387,7 +381,7 @@ class TestPuntingDTO:
     def test_percentage_validation(self):
         """Test touchback percentage in valid range."""
         with pytest.raises(ValidationError):
-            PuntingCreate(season=2023, tm="CAR", tb_pct=Decimal("150.0"))
+            PuntingCreate(season=2023, tm="CAR", tb_pct=150.0)
 
     def test_empty_team_name_rejected(self):
         """Test that empty team name is rejected."""